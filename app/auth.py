@@ -1,10 +1,14 @@
+import asyncio
 import httpx
+import orjson
 import secrets
-from urllib.parse import urlencode
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+import time
+from cachetools import TTLCache
+from urllib.parse import urlencode, quote_plus
+from datetime import datetime
+from typing import Optional, Dict, Tuple, Union
 from .config import settings
-from .database import db
+from .database import get_db, TokenRow
 
 class JohnDeereAuth:
     """Handles all OAuth 2.0 operations with John Deere"""
@@ -16,6 +20,26 @@ class JohnDeereAuth:
         self.authorization_url = settings.AUTHORIZATION_URL
         self.token_url = settings.TOKEN_URL
         self.scopes = settings.SCOPES
+        # Everything except `state` is fixed, so encode it once
+        self._auth_url_prefix = f"{self.authorization_url}?" + urlencode({
+            'response_type': 'code',
+            'client_id': self.client_id,
+            'redirect_uri': self.redirect_uri,
+            'scope': self.scopes
+        })
+        # Long-lived client so token calls reuse keep-alive connections
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'}
+        )
+        # Per-user locks so concurrent requests trigger a single refresh
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        # user_id -> (token row, expires_at as epoch seconds)
+        self._token_cache: Dict[str, Tuple[TokenRow, float]] = {}
+    
+    async def aclose(self):
+        """Close the underlying HTTP client (call on app shutdown)"""
+        await self._client.aclose()
     
     def generate_authorization_url(self, state: Optional[str] = None) -> tuple[str, str]:
         """
@@ -27,15 +51,7 @@ class JohnDeereAuth:
         if not state:
             state = secrets.token_urlsafe(32)
         
-        params = {
-            'response_type': 'code',
-            'client_id': self.client_id,
-            'redirect_uri': self.redirect_uri,
-            'scope': self.scopes,
-            'state': state
-        }
-        
-        auth_url = f"{self.authorization_url}?{urlencode(params)}"
+        auth_url = f"{self._auth_url_prefix}&state={quote_plus(state)}"
         return auth_url, state
     
     async def exchange_code_for_token(self, code: str) -> Dict:
@@ -56,23 +72,18 @@ class JohnDeereAuth:
             'client_secret': self.client_secret
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Token exchange failed: {response.text}")
-            
-            token_data = response.json()
-            
-            # Calculate expiration time
-            expires_in = token_data.get('expires_in', 43200)  # Default 12 hours
-            token_data['expires_at'] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
-            
-            return token_data
+        response = await self._client.post(self.token_url, data=data)
+        
+        if response.status_code != 200:
+            raise Exception(f"Token exchange failed: {response.text}")
+        
+        token_data = response.json()
+        
+        # Calculate expiration time
+        expires_in = token_data.get('expires_in', 43200)  # Default 12 hours
+        token_data['expires_at'] = int(time.time()) + expires_in
+        
+        return token_data
     
     async def refresh_access_token(self, refresh_token: str) -> Dict:
         """
@@ -91,63 +102,151 @@ class JohnDeereAuth:
             'client_secret': self.client_secret
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Token refresh failed: {response.text}")
-            
-            token_data = response.json()
-            
-            # Calculate expiration time
-            expires_in = token_data.get('expires_in', 43200)
-            token_data['expires_at'] = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
-            
-            return token_data
+        response = await self._client.post(self.token_url, data=data)
+        
+        if response.status_code != 200:
+            raise Exception(f"Token refresh failed: {response.text}")
+        
+        token_data = response.json()
+        
+        # Calculate expiration time
+        expires_in = token_data.get('expires_in', 43200)
+        token_data['expires_at'] = int(time.time()) + expires_in
+        
+        return token_data
+    
+    @staticmethod
+    def _expires_at_epoch(expires_at: Optional[Union[int, str]]) -> float:
+        """expires_at as epoch seconds (older rows stored an ISO string)"""
+        if not expires_at:
+            return 0
+        if isinstance(expires_at, str):
+            return datetime.fromisoformat(expires_at).timestamp()
+        return expires_at
+    
+    def _cache_token(self, user_id: str, token: TokenRow):
+        """Keep a decoded token in memory until it is about to expire"""
+        expires_at = self._expires_at_epoch(token.expires_at)
+        if expires_at:
+            self._token_cache[user_id] = (token, expires_at)
     
-    def is_token_expired(self, token_data: Dict) -> bool:
+    async def save_token(self, user_id: str, token_data: Dict):
+        """Persist a token and prime the in-memory cache"""
+        # SQLite calls run in a worker thread so they don't stall the event loop
+        await asyncio.to_thread(get_db().save_token, user_id, token_data)
+        self._cache_token(user_id, TokenRow(
+            token_data['access_token'],
+            token_data.get('refresh_token'),
+            token_data.get('expires_at')
+        ))
+    
+    def is_token_expired(self, token: TokenRow) -> bool:
         """Check if token is expired"""
-        if not token_data.get('expires_at'):
-            return True
-        
-        expires_at = datetime.fromisoformat(token_data['expires_at'])
         # Consider expired if less than 5 minutes remaining
-        return datetime.now() >= (expires_at - timedelta(minutes=5))
+        return time.time() >= self._expires_at_epoch(token.expires_at) - 300
+    
+    def _is_usable(self, token: TokenRow, rejected_token: Optional[str]) -> bool:
+        """Token is unexpired and isn't the one the API just rejected"""
+        return token.access_token != rejected_token and not self.is_token_expired(token)
     
-    async def get_valid_token(self, user_id: str) -> Optional[str]:
+    async def get_valid_token(self, user_id: str, rejected_token: Optional[str] = None) -> Optional[str]:
         """
         Get a valid access token for user, refreshing if necessary
         
         Args:
             user_id: User identifier
+            rejected_token: Access token the API just answered 401 for;
+                forces a refresh unless another request already replaced it
             
         Returns:
             Valid access token or None
         """
-        token_data = db.get_token(user_id)
+        # Hot path: cached token with more than 5 minutes left
+        cached = self._token_cache.get(user_id)
+        if cached and cached[0].access_token != rejected_token and time.time() < cached[1] - 300:
+            return cached[0].access_token
         
-        if not token_data:
+        token = await asyncio.to_thread(get_db().get_token, user_id)
+        
+        if not token:
             return None
         
-        # If token is expired, refresh it
-        if self.is_token_expired(token_data):
-            if token_data.get('refresh_token'):
-                try:
-                    new_token_data = await self.refresh_access_token(token_data['refresh_token'])
-                    # Update database with new token
-                    db.save_token(user_id, new_token_data)
-                    return new_token_data['access_token']
-                except Exception as e:
-                    print(f"Failed to refresh token: {e}")
-                    return None
-            else:
-                return None
+        # Token in the database is still valid, no locking needed
+        if self._is_usable(token, rejected_token):
+            self._cache_token(user_id, token)
+            return token.access_token
         
-        return token_data['access_token']
+        # setdefault is atomic on the event loop, so every waiter shares one lock
+        lock = self._refresh_locks.setdefault(user_id, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have refreshed while we were waiting
+            token = await asyncio.to_thread(get_db().get_token, user_id)
+            if not token:
+                return None
+            if self._is_usable(token, rejected_token):
+                self._cache_token(user_id, token)
+                return token.access_token
+            
+            if not token.refresh_token:
+                return None
+            
+            try:
+                new_token_data = await self.refresh_access_token(token.refresh_token)
+                # Update database (and cache) with new token
+                await self.save_token(user_id, new_token_data)
+                return new_token_data['access_token']
+            except Exception as e:
+                self._token_cache.pop(user_id, None)
+                print(f"Failed to refresh token: {e}")
+                return None
 
 # Global auth instance
 auth = JohnDeereAuth()
+
+
+# Pending login flows expire after this long (the CSRF state's lease)
+OAUTH_STATE_TTL_SECONDS = 600
+
+
+class OAuthStateStore:
+    """
+    Pending OAuth `state` values between /auth/login and /auth/callback.
+    
+    Stored in Redis with a TTL when REDIS_URL is set, so every worker sees
+    every flow and abandoned ones expire on their own; otherwise kept in a
+    bounded, expiring in-process cache (single worker only).
+    """
+    
+    def __init__(self, redis_url: Optional[str] = None):
+        self._redis = None
+        self._local = None
+        if redis_url:
+            # Optional dependency: only needed when Redis is configured
+            import redis.asyncio as redis
+            self._redis = redis.from_url(redis_url)
+        else:
+            self._local = TTLCache(maxsize=10_000, ttl=OAUTH_STATE_TTL_SECONDS)
+    
+    async def put(self, state: str, data: Dict):
+        """Remember a state for one callback"""
+        if self._redis is not None:
+            await self._redis.set(f"oauth:{state}", orjson.dumps(data), ex=OAUTH_STATE_TTL_SECONDS)
+        else:
+            self._local[state] = data
+    
+    async def pop(self, state: str) -> Optional[Dict]:
+        """Take a state's data (None if unknown or expired); each state works once"""
+        if self._redis is not None:
+            raw = await self._redis.getdel(f"oauth:{state}")
+            return orjson.loads(raw) if raw is not None else None
+        # pop with a default: the entry may expire between a check and the pop
+        return self._local.pop(state, None)
+    
+    async def aclose(self):
+        """Close the Redis connection pool, if any"""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# Global OAuth state store
+oauth_states = OAuthStateStore(settings.REDIS_URL)
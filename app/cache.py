@@ -0,0 +1,158 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from cachetools import TTLCache
+from .database import get_db
+from .jdoc_api import jdoc_client
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Field listings change rarely; boundaries (large, and slower still to
+# change) are kept longer than the plain id/name listings
+FIELDS_TTL_SECONDS = 300
+FIELDS_WITH_BOUNDARIES_TTL_SECONDS = 3600
+FIELDS_CACHE_SIZE = 4096
+
+# Organization listings per farmer; syncs refresh them explicitly
+ORGANIZATIONS_TTL_SECONDS = 300
+ORGANIZATIONS_CACHE_SIZE = 1024
+
+
+class FieldsCache:
+    """
+    In-process cache of JDOC field listings per (farmer_id, org_id).
+
+    Entries expire lazily on read and are replaced whenever a sync fetches
+    the org's fields fresh (store); concurrent misses for the same org
+    share one upstream request.
+    """
+
+    def __init__(self):
+        # include_boundaries -> {(farmer_id, org_id): fields}
+        self._entries: Dict[bool, TTLCache] = {
+            False: TTLCache(maxsize=FIELDS_CACHE_SIZE, ttl=FIELDS_TTL_SECONDS),
+            True: TTLCache(maxsize=FIELDS_CACHE_SIZE, ttl=FIELDS_WITH_BOUNDARIES_TTL_SECONDS),
+        }
+        # (farmer_id, org_id) -> {field_id: field_name}, built from a listing
+        self._names = TTLCache(maxsize=FIELDS_CACHE_SIZE, ttl=FIELDS_TTL_SECONDS)
+        # Per-org locks so concurrent misses trigger a single fetch
+        self._locks: Dict[Tuple[str, str, bool], asyncio.Lock] = {}
+
+    def _lookup(self, key: Tuple[str, str], include_boundaries: bool) -> Optional[List[Dict]]:
+        fields = self._entries[include_boundaries].get(key)
+        if fields is None and not include_boundaries:
+            # A listing with boundaries answers a plain listing too
+            fields = self._entries[True].get(key)
+        return fields
+
+    def store(self, farmer_id: str, org_id: str, include_boundaries: bool, fields: List[Dict]):
+        """Replace the cached listing with one that was just fetched"""
+        key = (farmer_id, org_id)
+        self._entries[include_boundaries][key] = fields
+        self._names.pop(key, None)
+        if include_boundaries:
+            # The plain listing may now be staler than this one
+            self._entries[False].pop(key, None)
+
+    async def get_fields(self, farmer_id: str, org_id: str, include_boundaries: bool = True) -> List[Dict]:
+        """jdoc_client.get_fields, served from the cache while it is fresh"""
+        key = (farmer_id, org_id)
+        fields = self._lookup(key, include_boundaries)
+        if fields is not None:
+            return fields
+
+        # setdefault is atomic on the event loop, so every waiter shares one lock
+        lock = self._locks.setdefault((farmer_id, org_id, include_boundaries), asyncio.Lock())
+        async with lock:
+            # Another coroutine may have fetched while we were waiting
+            fields = self._lookup(key, include_boundaries)
+            if fields is not None:
+                return fields
+            fields = await jdoc_client.get_fields(farmer_id, org_id, include_boundaries=include_boundaries)
+            self._entries[include_boundaries][key] = fields
+            return fields
+
+    async def get_fields_many(self, farmer_id: str, org_ids: List[str], include_boundaries: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Cached get_fields for several organizations concurrently
+
+        Returns:
+            Dict mapping org_id -> list of field dictionaries.
+            Orgs whose request failed are logged and left out.
+        """
+        results = await jdoc_client.gather_limited(
+            [self.get_fields(farmer_id, org_id, include_boundaries) for org_id in org_ids]
+        )
+
+        fields_by_org = {}
+        for org_id, result in zip(org_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching fields for org {org_id}: {result}")
+                continue
+            fields_by_org[org_id] = result
+        return fields_by_org
+
+    async def get_field_name(self, farmer_id: str, org_id: str, field_id: str) -> str:
+        """
+        Name of a field, from a cached listing or the fields table when
+        possible and otherwise from the single-field resource (never the
+        whole list). Falls back to field_id if the field can't be fetched.
+        """
+        key = (farmer_id, org_id)
+        names = self._names.get(key)
+        if names is None:
+            fields = self._lookup(key, include_boundaries=False)
+            if fields is not None:
+                names = {field.get("id"): field.get("name", field.get("id")) for field in fields}
+                self._names[key] = names
+        if names is not None and field_id in names:
+            return names[field_id] or field_id
+        
+        name = await asyncio.to_thread(get_db().get_field_name, org_id, field_id)
+        if name:
+            self._names.setdefault(key, {})[field_id] = name
+            return name
+        
+        try:
+            field = await jdoc_client.get_field(farmer_id, org_id, field_id)
+        except Exception as e:
+            logger.warning(f"Could not fetch field {field_id} in org {org_id}: {e}")
+            return field_id
+        name = field.get("name") or field_id
+        self._names.setdefault(key, {})[field_id] = name
+        return name
+
+
+class OrganizationsCache:
+    """
+    In-process cache of JDOC organization listings per farmer, with the
+    same single-flight behaviour as FieldsCache.
+    """
+
+    def __init__(self):
+        self._entries = TTLCache(maxsize=ORGANIZATIONS_CACHE_SIZE, ttl=ORGANIZATIONS_TTL_SECONDS)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def store(self, farmer_id: str, organizations: List[Dict]):
+        """Replace the cached listing with one that was just fetched"""
+        self._entries[farmer_id] = organizations
+
+    async def get_organizations(self, farmer_id: str) -> List[Dict]:
+        """jdoc_client.get_organizations, served from the cache while it is fresh"""
+        organizations = self._entries.get(farmer_id)
+        if organizations is not None:
+            return organizations
+
+        lock = self._locks.setdefault(farmer_id, asyncio.Lock())
+        async with lock:
+            organizations = self._entries.get(farmer_id)
+            if organizations is not None:
+                return organizations
+            organizations = await jdoc_client.get_organizations(farmer_id)
+            self._entries[farmer_id] = organizations
+            return organizations
+
+
+# Global cache instances
+fields_cache = FieldsCache()
+organizations_cache = OrganizationsCache()
@@ -12,6 +12,7 @@ class Settings:
     
     # Environment
     ENVIRONMENT = os.getenv("ENVIRONMENT", "sandbox")  # sandbox or production
+    DEBUG = os.getenv("DEBUG", "false").lower() in ("1", "true", "yes")
     
     # OAuth URLs
     WELL_KNOWN_URL = "https://signin.johndeere.com/oauth2/aus78tnlaysMraFhC1t7/.well-known/oauth-authorization-server"
@@ -26,6 +27,15 @@ class Settings:
     def api_base_url(self):
         return self.API_BASE_SANDBOX if self.ENVIRONMENT == "sandbox" else self.API_BASE_PRODUCTION
     
+    # JDOC fan-out limits: batch items in flight across all syncs, and how
+    # long one page request (not a field's whole paginated walk) may take
+    JDOC_MAX_CONCURRENCY = int(os.getenv("JDOC_MAX_CONCURRENCY", "16"))
+    JDOC_CALL_TIMEOUT_SECONDS = float(os.getenv("JDOC_CALL_TIMEOUT_SECONDS", "60"))
+    
+    # Worker processes for normalizing large fields, per app worker (0 or 1
+    # normalizes on the event loop thread instead)
+    NORMALIZE_POOL_WORKERS = int(os.getenv("NORMALIZE_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+    
     # OAuth Scopes (what permissions we need)
     SCOPES = "org1 org2 ag2 eq1 offline_access"
     
@@ -36,6 +46,9 @@ class Settings:
     # Database (kept for backwards compatibility, not used in S3 approach)
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./agricapture.db")
     
+    # Redis for state shared across workers (optional; in-process if unset)
+    REDIS_URL = os.getenv("REDIS_URL")
+    
     # Security
     SECRET_KEY = os.getenv("SECRET_KEY", "change-this-secret-key-in-production")
 
@@ -1,19 +1,510 @@
 import sqlite3
-import json
-from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+import orjson
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Optional, Dict, Iterator, List, Set, Tuple, Union
+
+
+# Applied to every persistent connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+READ_POOL_SIZE = 4
+
+# Rows fetched per step when streaming a query (CSV downloads)
+STREAM_BATCH_SIZE = 1000
+
+# Bump whenever init_db's DDL changes so existing databases pick it up
+SCHEMA_VERSION = 8
+
+# Incremental syncs restart this far before the previous window's end, so
+# operations JDOC records late (around the end timestamp) aren't missed
+INCREMENTAL_SYNC_OVERLAP = timedelta(minutes=15)
+
+# Statements are module constants so every call passes the identical string
+# and sqlite3's per-connection statement cache skips re-preparing them.
+# get_token / save_token are the hot ones (every authenticated JDOC call).
+_SQL_GET_TOKEN = "SELECT access_token, refresh_token, expires_at FROM user_tokens WHERE user_id = ?"
+
+_SQL_SAVE_TOKEN = '''
+    INSERT OR REPLACE INTO user_tokens
+    (user_id, access_token, refresh_token, token_type, expires_at, scopes, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_SAVE_ORGANIZATION = '''
+    INSERT OR REPLACE INTO connected_organizations
+    (user_id, org_id, org_name, org_type, is_enabled)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_SQL_GET_ORGANIZATIONS = '''
+    SELECT id, user_id, org_id, org_name, org_type, is_enabled, created_at
+    FROM connected_organizations
+    WHERE user_id = ?
+    ORDER BY created_at DESC
+'''
+
+_SQL_SAVE_SYNC_STATE = '''
+    INSERT OR REPLACE INTO field_sync_state
+    (farmer_id, org_id, field_id, field_name, last_synced_at, last_sync_mode, last_sync_start_date, last_sync_end_date, last_sync_overlap_from, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_GET_SYNC_STATE = '''
+    SELECT field_name, last_synced_at, last_sync_mode, last_sync_start_date, last_sync_end_date, last_sync_overlap_from
+    FROM field_sync_state
+    WHERE farmer_id = ? AND org_id = ? AND field_id = ?
+'''
+
+_SYNC_STATE_COLUMNS = ('field_name', 'last_synced_at', 'last_sync_mode', 'last_sync_start_date', 'last_sync_end_date', 'last_sync_overlap_from')
+
+_SQL_GET_ALL_SYNC_STATES = '''
+    SELECT id, farmer_id, org_id, field_id, field_name, last_synced_at, last_sync_mode,
+           last_sync_start_date, last_sync_end_date, last_sync_overlap_from, created_at, updated_at
+    FROM field_sync_state
+    WHERE farmer_id = ?
+    ORDER BY updated_at DESC
+'''
+
+# One watermark per (farmer, org): the end of the last window in which
+# /admin/sync/farmer stored every field of the org. Its incremental syncs
+# start the org's fields from it instead of reading a state row per field.
+# Export-only paths (snapshot, single-field sync) keep their own per-field
+# cursors in field_sync_state. A watermark never moves backwards: a window
+# ending before it (an explicit end_date) leaves it as is. Callers store
+# timestamps in JDOC's format (see jdoc_timestamp), so MAX on the strings
+# compares them chronologically.
+_SQL_SAVE_SYNC_WATERMARK = '''
+    INSERT INTO sync_watermarks (farmer_id, org_id, watermark_ts, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(farmer_id, org_id) DO UPDATE SET
+        watermark_ts = MAX(COALESCE(watermark_ts, ''), excluded.watermark_ts),
+        updated_at = excluded.updated_at
+'''
+
+_SQL_GET_SYNC_WATERMARKS = "SELECT org_id, watermark_ts FROM sync_watermarks WHERE farmer_id = ?"
+
+_SQL_INSERT_NORMALIZED_OPERATION = '''
+    INSERT INTO operations_normalized (
+        operation_id, field_id, org_id,
+        operation_type, operation_date,
+        start_time, end_time,
+        crop_name, product_name, product_category,
+        rate_value, rate_unit,
+        total_amount, total_amount_unit,
+        area_ha, equipment_name, notes,
+        org_name, field_name,
+        normalized_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+
+# Row keys after operation_id/field_id/org_id, in _SQL_INSERT_NORMALIZED_OPERATION order
+_normalized_operation_values = itemgetter(
+    'operation_type', 'operation_date', 'start_time', 'end_time',
+    'crop_name', 'product_name', 'product_category',
+    'rate_value', 'rate_unit', 'total_amount', 'total_amount_unit',
+    'area_ha', 'equipment_name', 'notes', 'org_name', 'field_name',
+)
+
+_SQL_UPSERT_ORGANIZATION = '''
+    INSERT INTO organizations (org_id, farmer_id, name, type, country, time_zone, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT(org_id) DO UPDATE SET
+        farmer_id = excluded.farmer_id,
+        name = excluded.name,
+        type = excluded.type,
+        country = excluded.country,
+        time_zone = excluded.time_zone,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+_SQL_UPSERT_FIELD = '''
+    INSERT INTO fields (field_id, org_id, name, external_id, area_ha, geometry_json, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    ON CONFLICT(field_id) DO UPDATE SET
+        org_id = excluded.org_id,
+        name = excluded.name,
+        external_id = excluded.external_id,
+        area_ha = excluded.area_ha,
+        geometry_json = excluded.geometry_json,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+_SQL_GET_FIELD_NAME = "SELECT name FROM fields WHERE field_id = ? AND org_id = ?"
+
+# Set by /admin/sync/farmer once a field's operations are stored. Fields
+# without it (new to the org, or only listed through the fields endpoint)
+# are fetched from the start rather than from the org watermark.
+_SQL_MARK_FIELD_OPS_SYNCED = "UPDATE fields SET ops_synced_at = ? WHERE field_id = ?"
+
+_SQL_GET_OPS_SYNCED_FIELDS = '''
+    SELECT f.org_id, f.field_id
+    FROM fields f
+    JOIN organizations o ON o.org_id = f.org_id
+    WHERE o.farmer_id = ? AND f.ops_synced_at IS NOT NULL
+'''
+
+_SQL_GET_ORG_AND_FIELD_NAMES = '''
+    SELECT o.name, f.name
+    FROM fields f
+    LEFT JOIN organizations o ON o.org_id = f.org_id
+    WHERE f.field_id = ? AND f.org_id = ?
+'''
+
+_SQL_UPSERT_RAW_OPERATION = '''
+    INSERT INTO operations_raw (operation_id, field_id, org_id, raw_json, event_start, event_end, ingested_at)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(operation_id) DO UPDATE SET
+        field_id = excluded.field_id,
+        org_id = excluded.org_id,
+        raw_json = excluded.raw_json,
+        event_start = excluded.event_start,
+        event_end = excluded.event_end,
+        ingested_at = CURRENT_TIMESTAMP
+'''
+
+# Names are stored on each row (see insert_normalized_operations), so the
+# admin listing is a single-table read with no joins
+_SQL_LIST_NORMALIZED_OPERATIONS = '''
+    SELECT
+      operation_id,
+      org_id,
+      org_name,
+      field_id,
+      field_name,
+      operation_type,
+      operation_date,
+      start_time,
+      end_time,
+      crop_name,
+      product_name,
+      product_category,
+      rate_value,
+      rate_unit,
+      total_amount,
+      total_amount_unit,
+      area_ha,
+      equipment_name,
+      notes
+    FROM operations_normalized
+'''
+
+# One fixed statement per filter combination, keyed by (has org_id, has field_id).
+# Kept as separate equality predicates rather than "(:x IS NULL OR col = :x)"
+# so the planner can still use idx_opn_org_field.
+_NORMALIZED_OPERATIONS_FILTERS = {
+    (False, False): "",
+    (True, False): " WHERE org_id = :org_id",
+    (False, True): " WHERE field_id = :field_id",
+    (True, True): " WHERE org_id = :org_id AND field_id = :field_id",
+}
+_SQL_LIST_NORMALIZED_OPERATIONS_BY_FILTER = {
+    key: _SQL_LIST_NORMALIZED_OPERATIONS + where for key, where in _NORMALIZED_OPERATIONS_FILTERS.items()
+}
+# Paged by id so pages are stable and never overlap or skip rows
+_SQL_PAGE_NORMALIZED_OPERATIONS_BY_FILTER = {
+    key: sql + " ORDER BY id LIMIT :limit OFFSET :offset" for key, sql in _SQL_LIST_NORMALIZED_OPERATIONS_BY_FILTER.items()
+}
+_SQL_COUNT_NORMALIZED_OPERATIONS_BY_FILTER = {
+    key: "SELECT COUNT(*) FROM operations_normalized" + where for key, where in _NORMALIZED_OPERATIONS_FILTERS.items()
+}
+
+# Boundary facts are pulled out of the stored JSON by SQLite's JSON1
+# functions, so the multi-KB geometry never has to come back to Python
+_SQL_FIELD_BOUNDARY_SUMMARIES = '''
+    SELECT
+      f.field_id,
+      f.name,
+      f.area_ha,
+      json_array_length(f.geometry_json) AS boundary_count,
+      (SELECT json_extract(b.value, '$.id') FROM json_each(f.geometry_json) b
+       WHERE json_extract(b.value, '$.active') = 1 LIMIT 1) AS active_boundary_id,
+      (SELECT json_extract(b.value, '$.area.valueAsDouble') FROM json_each(f.geometry_json) b
+       WHERE json_extract(b.value, '$.active') = 1 LIMIT 1) AS active_boundary_area_ha
+    FROM fields f
+    WHERE f.org_id = ?
+    ORDER BY f.name
+'''
+
+# Tables the admin views may dump; the SQL is fixed per table so nothing
+# user-supplied is ever interpolated into a statement
+ADMIN_TABLES = frozenset({
+    "organizations",
+    "fields",
+    "operations_raw",
+    "operations_normalized",
+    "field_sync_state",
+    "sync_watermarks",
+    "connected_organizations",
+    "user_tokens",
+})
+
+_SQL_SELECT_ALL = {table: f"SELECT * FROM {table}" for table in ADMIN_TABLES}
+_SQL_SELECT_PAGE = {table: f"SELECT * FROM {table} ORDER BY rowid LIMIT ? OFFSET ?" for table in ADMIN_TABLES}
+_SQL_COUNT_ALL = {table: f"SELECT COUNT(*) FROM {table}" for table in ADMIN_TABLES}
+
+# Maintain dashboard_counters on every insert/delete (and area change).
+# organizations and fields are upserted with ON CONFLICT DO UPDATE, which
+# fires the UPDATE triggers rather than INSERT, so re-syncs don't double
+# count them. operations_normalized rows are plain INSERTs, so every
+# insert is counted, re-synced operations included, matching COUNT(*).
+_DASHBOARD_COUNTER_TRIGGERS = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_org_ai AFTER INSERT ON organizations BEGIN
+        UPDATE dashboard_counters SET v = v + 1 WHERE k = 'organizations_count';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_org_ad AFTER DELETE ON organizations BEGIN
+        UPDATE dashboard_counters SET v = v - 1 WHERE k = 'organizations_count';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_fields_ai AFTER INSERT ON fields BEGIN
+        UPDATE dashboard_counters SET v = v + 1 WHERE k = 'fields_count';
+        UPDATE dashboard_counters SET v = v + COALESCE(NEW.area_ha, 0) WHERE k = 'total_area_ha';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_fields_ad AFTER DELETE ON fields BEGIN
+        UPDATE dashboard_counters SET v = v - 1 WHERE k = 'fields_count';
+        UPDATE dashboard_counters SET v = v - COALESCE(OLD.area_ha, 0) WHERE k = 'total_area_ha';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_fields_au_area AFTER UPDATE OF area_ha ON fields BEGIN
+        UPDATE dashboard_counters
+        SET v = v - COALESCE(OLD.area_ha, 0) + COALESCE(NEW.area_ha, 0)
+        WHERE k = 'total_area_ha';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_opn_ai AFTER INSERT ON operations_normalized BEGIN
+        UPDATE dashboard_counters SET v = v + 1 WHERE k = 'operations_count';
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS trg_opn_ad AFTER DELETE ON operations_normalized BEGIN
+        UPDATE dashboard_counters SET v = v - 1 WHERE k = 'operations_count';
+    END
+    ''',
+)
+
+# All admin dashboard counters in one round trip. Distinct farmers can't be
+# kept by a simple counter, but organizations is small enough to count live.
+_SQL_DASHBOARD_SUMMARY = '''
+    SELECT
+        (SELECT CAST(v AS INTEGER) FROM dashboard_counters WHERE k = 'organizations_count'),
+        (SELECT COUNT(DISTINCT farmer_id) FROM organizations),
+        (SELECT CAST(v AS INTEGER) FROM dashboard_counters WHERE k = 'fields_count'),
+        (SELECT v FROM dashboard_counters WHERE k = 'total_area_ha'),
+        (SELECT CAST(v AS INTEGER) FROM dashboard_counters WHERE k = 'operations_count')
+'''
+
+# Room for every hoisted statement plus the filter variants of the
+# normalized-operations query without evicting the hot token lookups
+STATEMENT_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
+class TokenRow:
+    """The token columns the auth hot path actually reads"""
+    access_token: str
+    refresh_token: Optional[str]
+    # Epoch seconds, or the ISO text rows written before that format
+    expires_at: Optional[Union[int, str]]
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> bool:
+    """ALTER TABLE ADD COLUMN for any of `columns` the table lacks; True if any were added"""
+    existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+    added = False
+    for name, decl in columns.items():
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+            added = True
+    return added
+
+
+def _parse_utc(value: str) -> datetime:
+    """Aware UTC datetime from an ISO timestamp; naive input is taken as UTC (ValueError if unparseable)"""
+    parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _jdoc_format(moment: datetime) -> str:
+    """JDOC's timestamp format: UTC, milliseconds, trailing Z"""
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def jdoc_timestamp(value: str) -> str:
+    """Any ISO timestamp in JDOC's format, so stored timestamps compare as strings (ValueError if unparseable)"""
+    return _jdoc_format(_parse_utc(value))
+
+
+def _overlap_from(end_date: Optional[str]) -> Optional[str]:
+    """Next incremental start for a window ending at `end_date` (None if unparseable)"""
+    if not end_date:
+        return None
+    try:
+        end = _parse_utc(end_date)
+    except ValueError:
+        return None
+    return _jdoc_format(end - INCREMENTAL_SYNC_OVERLAP)
+
+
+def _select_all_sql(table: str) -> str:
+    """Look up the fixed SELECT for an admin table"""
+    try:
+        return _SQL_SELECT_ALL[table]
+    except KeyError:
+        raise ValueError(f"Unknown table: {table}") from None
+
+
+def _rows_as_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """Fetch all rows as dicts, reading the column names once per query"""
+    cols = [d[0] for d in cursor.description]
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+def _is_enabled(org_data: Dict) -> int:
+    """1 if the org exposes a manage_connection link (connection already enabled)"""
+    links = org_data.get('links') or []
+    return 1 if any(link.get('rel') == 'manage_connection' for link in links) else 0
+
+
+def _field_row(org_id: str, field_data: Dict) -> tuple:
+    """Parameters for _SQL_UPSERT_FIELD from a JDOC field"""
+    geometry_json = None
+    if 'boundaries' in field_data:
+        try:
+            geometry_json = orjson.dumps(field_data.get('boundaries')).decode()
+        except Exception:
+            geometry_json = None
+
+    area = field_data.get('area')
+    area_ha = area.get('value') if isinstance(area, dict) else None
+
+    return (
+        field_data.get('id'),
+        org_id,
+        field_data.get('name'),
+        field_data.get('externalId'),
+        area_ha,
+        geometry_json
+    )
 
 
 class Database:
-    def __init__(self, db_path: str = "agricapture.db"):
+    def __init__(self, db_path: str = "agricapture.db", read_pool_size: int = READ_POOL_SIZE):
         self.db_path = db_path
         self.init_db()
+
+        # One writer connection (SQLite allows a single writer at a time)
+        # plus a small pool of readers; WAL lets them run concurrently.
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._read_pool: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(read_pool_size):
+            self._read_pool.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a long-lived autocommit connection with tuned PRAGMAs"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_read(self) -> sqlite3.Connection:
+        """Borrow a reader connection from the pool (blocks if all are in use)"""
+        return self._read_pool.get()
+
+    def _put_read(self, conn: sqlite3.Connection):
+        """Return a reader connection to the pool"""
+        self._read_pool.put(conn)
+
+    @contextmanager
+    def reader(self):
+        conn = self._get_read()
+        try:
+            yield conn
+        finally:
+            self._put_read(conn)
+
+    @contextmanager
+    def _writer(self, conn: Optional[sqlite3.Connection] = None):
+        # A conn handed in by the caller comes from transaction(), which
+        # already holds the write lock
+        if conn is not None:
+            yield conn
+            return
+        with self._write_lock:
+            yield self._write_conn
+
+    @contextmanager
+    def transaction(self, conn: Optional[sqlite3.Connection] = None):
+        """
+        Run several writes on the writer connection as one transaction (one fsync).
+        Pass the yielded connection as `conn=` to the write methods.
+        Don't await inside the block: the write lock is held until it exits.
+        """
+        if conn is not None:
+            yield conn
+            return
+        with self._writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
     
     def init_db(self):
-        """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        """Initialize the database with required tables (skipped if already current)"""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+
+            # Check and migrate under the write lock so concurrent workers
+            # starting together don't race each other through the DDL
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] >= SCHEMA_VERSION:
+                cursor.execute("ROLLBACK")
+                return
+            try:
+                self._migrate(cursor)
+            except BaseException:
+                # Release the write lock now rather than when the
+                # connection is collected, so a retry isn't "database is locked"
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _migrate(self, cursor: sqlite3.Cursor):
+        """init_db's DDL, run inside its BEGIN IMMEDIATE"""
         # Table to store user tokens
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS user_tokens (
@@ -55,6 +546,7 @@ class Database:
                 last_sync_mode TEXT,
                 last_sync_start_date TEXT,
                 last_sync_end_date TEXT,
+                last_sync_overlap_from TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 UNIQUE(farmer_id, org_id, field_id)
@@ -123,297 +615,373 @@ class Database:
                 area_ha REAL,
                 equipment_name TEXT,
                 notes TEXT,
-                normalized_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                normalized_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                org_name TEXT,
+                field_name TEXT
             )
         ''')
 
-        conn.commit()
-        conn.close()
+        # Indexes covering both the WHERE and ORDER BY of the per-user lookups
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_orgs_user
+            ON connected_organizations(user_id, created_at DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sync_farmer
+            ON field_sync_state(farmer_id, updated_at DESC)
+        ''')
+        # get_sync_state is served by the UNIQUE(farmer_id, org_id, field_id) index
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_opn_org_field
+            ON operations_normalized(org_id, field_id)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_opr_field
+            ON operations_raw(field_id)
+        ''')
+        # v6: the field-only filter of the normalized listing/CSV can't use
+        # idx_opn_org_field (org_id leads it)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_opn_field
+            ON operations_normalized(field_id)
+        ''')
+
+        # v3: org/field names denormalized onto operations so reads skip the joins
+        if _add_missing_columns(cursor, "operations_normalized", {"org_name": "TEXT", "field_name": "TEXT"}):
+            cursor.execute('''
+                UPDATE operations_normalized SET
+                    org_name = (SELECT name FROM organizations WHERE org_id = operations_normalized.org_id),
+                    field_name = (SELECT name FROM fields WHERE field_id = operations_normalized.field_id)
+            ''')
+
+        # v4: dashboard counters kept current by triggers instead of
+        # aggregating the whole tables on every admin page load
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dashboard_counters (
+                k TEXT PRIMARY KEY,
+                v REAL NOT NULL DEFAULT 0
+            )
+        ''')
+        for trigger_sql in _DASHBOARD_COUNTER_TRIGGERS:
+            cursor.execute(trigger_sql)
+        # (Re)seed from the real tables so existing data is counted
+        cursor.execute('''
+            INSERT OR REPLACE INTO dashboard_counters (k, v)
+            VALUES
+                ('organizations_count', (SELECT COUNT(*) FROM organizations)),
+                ('fields_count', (SELECT COUNT(*) FROM fields)),
+                ('total_area_ha', (SELECT COALESCE(SUM(area_ha), 0) FROM fields)),
+                ('operations_count', (SELECT COUNT(*) FROM operations_normalized))
+        ''')
+
+        # v5: overlap-adjusted start for the next incremental sync
+        if _add_missing_columns(cursor, "field_sync_state", {"last_sync_overlap_from": "TEXT"}):
+            cursor.execute('''
+                UPDATE field_sync_state
+                SET last_sync_overlap_from = strftime('%Y-%m-%dT%H:%M:%fZ', last_sync_end_date, '-15 minutes')
+                WHERE last_sync_end_date IS NOT NULL
+            ''')
+
+        # v7: per-org sync watermarks, seeded with the oldest end of the
+        # per-field states, and only for orgs where every stored field has one
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sync_watermarks (
+                farmer_id TEXT NOT NULL,
+                org_id TEXT NOT NULL,
+                watermark_ts TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (farmer_id, org_id)
+            )
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO sync_watermarks (farmer_id, org_id, watermark_ts, updated_at)
+            SELECT s.farmer_id, s.org_id, MIN(s.last_sync_end_date), CURRENT_TIMESTAMP
+            FROM field_sync_state s
+            WHERE s.last_sync_end_date IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM fields f
+                  WHERE f.org_id = s.org_id
+                    AND NOT EXISTS (
+                        SELECT 1 FROM field_sync_state s2
+                        WHERE s2.farmer_id = s.farmer_id
+                          AND s2.org_id = f.org_id
+                          AND s2.field_id = f.field_id
+                          AND s2.last_sync_end_date IS NOT NULL
+                    )
+              )
+            GROUP BY s.farmer_id, s.org_id
+        ''')
+
+        # v8: which fields the farmer sync has stored operations for. Left
+        # unset on existing rows, so the next farmer sync fetches every
+        # field from the start once (the old states were also written by
+        # export-only paths and can't prove anything was stored)
+        _add_missing_columns(cursor, "fields", {"ops_synced_at": "TIMESTAMP"})
+
+        # Give the planner statistics for the new indexes
+        cursor.execute("ANALYZE")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     
-    def save_token(self, user_id: str, token_data: Dict):
+    def save_token(self, user_id: str, token_data: Dict, conn: Optional[sqlite3.Connection] = None):
         """Save or update user tokens"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO user_tokens 
-            (user_id, access_token, refresh_token, token_type, expires_at, scopes, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            user_id,
-            token_data.get('access_token'),
-            token_data.get('refresh_token'),
-            token_data.get('token_type'),
-            token_data.get('expires_at'),
-            token_data.get('scope'),
-            datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_SAVE_TOKEN, (
+                user_id,
+                token_data.get('access_token'),
+                token_data.get('refresh_token'),
+                token_data.get('token_type'),
+                token_data.get('expires_at'),
+                token_data.get('scope'),
+                datetime.now()
+            ))
     
-    def get_token(self, user_id: str) -> Optional[Dict]:
+    def get_token(self, user_id: str) -> Optional[TokenRow]:
         """Retrieve user tokens"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM user_tokens WHERE user_id = ?', (user_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_TOKEN, (user_id,)).fetchone()
         
         if row:
-            return dict(row)
+            return TokenRow(*row)
         return None
     
-    def save_organization(self, user_id: str, org_data: Dict):
+    def save_organization(self, user_id: str, org_data: Dict, conn: Optional[sqlite3.Connection] = None):
         """Save connected organization"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO connected_organizations 
-            (user_id, org_id, org_name, org_type, is_enabled)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            user_id,
-            org_data.get('id'),
-            org_data.get('name'),
-            org_data.get('type'),
-            1 if 'manage_connection' in str(org_data.get('links', [])) else 0
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_SAVE_ORGANIZATION, (
+                user_id,
+                org_data.get('id'),
+                org_data.get('name'),
+                org_data.get('type'),
+                _is_enabled(org_data)
+            ))
+    
+    def save_organizations_bulk(self, user_id: str, orgs: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """Save many connected organizations in a single transaction"""
+        rows = [
+            (
+                user_id,
+                org_data.get('id'),
+                org_data.get('name'),
+                org_data.get('type'),
+                _is_enabled(org_data)
+            )
+            for org_data in orgs
+        ]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_SAVE_ORGANIZATION, rows)
     
     def get_organizations(self, user_id: str):
         """Get all organizations for a user"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM connected_organizations 
-            WHERE user_id = ?
-            ORDER BY created_at DESC
-        ''', (user_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        with self.reader() as conn:
+            return _rows_as_dicts(conn.execute(_SQL_GET_ORGANIZATIONS, (user_id,)))
     
-    def save_sync_state(self, farmer_id: str, org_id: str, field_id: str, field_name: str, sync_mode: str, start_date: str, end_date: str):
+    def save_sync_state(self, farmer_id: str, org_id: str, field_id: str, field_name: str, sync_mode: str, start_date: str, end_date: str, conn: Optional[sqlite3.Connection] = None):
         """Save sync history for a field"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO field_sync_state 
-            (farmer_id, org_id, field_id, field_name, last_synced_at, last_sync_mode, last_sync_start_date, last_sync_end_date, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            farmer_id,
-            org_id,
-            field_id,
-            field_name,
-            datetime.now(),
-            sync_mode,
-            start_date,
-            end_date,
-            datetime.now()
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_SAVE_SYNC_STATE, (
+                farmer_id,
+                org_id,
+                field_id,
+                field_name,
+                datetime.now(),
+                sync_mode,
+                start_date,
+                end_date,
+                _overlap_from(end_date),
+                datetime.now()
+            ))
+    
+    def save_sync_states_bulk(self, states: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """
+        Save sync history for many fields in a single transaction.
+        Each dict takes the same keys as save_sync_state's arguments.
+        """
+        now = datetime.now()
+        rows = [
+            (
+                state['farmer_id'],
+                state['org_id'],
+                state['field_id'],
+                state.get('field_name'),
+                now,
+                state.get('sync_mode'),
+                state.get('start_date'),
+                state.get('end_date'),
+                _overlap_from(state.get('end_date')),
+                now
+            )
+            for state in states
+        ]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_SAVE_SYNC_STATE, rows)
     
     def get_sync_state(self, farmer_id: str, org_id: str, field_id: str) -> Optional[Dict]:
         """Get the last sync info for a field"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM field_sync_state 
-            WHERE farmer_id = ? AND org_id = ? AND field_id = ?
-        ''', (farmer_id, org_id, field_id))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_SYNC_STATE, (farmer_id, org_id, field_id)).fetchone()
         
         if row:
-            return dict(row)
+            return dict(zip(_SYNC_STATE_COLUMNS, row))
         return None
     
     def get_all_sync_states(self, farmer_id: str) -> List[Dict]:
         """Get all sync states for a farmer"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM field_sync_state 
-            WHERE farmer_id = ?
-            ORDER BY updated_at DESC
-        ''', (farmer_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        with self.reader() as conn:
+            return _rows_as_dicts(conn.execute(_SQL_GET_ALL_SYNC_STATES, (farmer_id,)))
+
+    def save_sync_watermarks_bulk(self, farmer_id: str, watermarks: Dict[str, str], conn: Optional[sqlite3.Connection] = None):
+        """Advance the sync watermark of each org in {org_id: window_end} (never moves one back)"""
+        now = datetime.now()
+        rows = [(farmer_id, org_id, end_date, now) for org_id, end_date in watermarks.items()]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_SAVE_SYNC_WATERMARK, rows)
+
+    def get_sync_watermarks(self, farmer_id: str) -> Dict[str, str]:
+        """{org_id: start of the next incremental window} for every synced org of a farmer"""
+        with self.reader() as conn:
+            rows = conn.execute(_SQL_GET_SYNC_WATERMARKS, (farmer_id,)).fetchall()
+        watermarks = {}
+        for org_id, watermark_ts in rows:
+            start = _overlap_from(watermark_ts)
+            if start:
+                watermarks[org_id] = start
+        return watermarks
 
     # ---------- NEW: Organizations & Fields ----------
 
-    def upsert_organization(self, farmer_id: str, org_data: Dict):
+    def upsert_organization(self, farmer_id: str, org_data: Dict, conn: Optional[sqlite3.Connection] = None):
         """Insert or update an organization record"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_UPSERT_ORGANIZATION, (
+                org_data.get('id'),
+                farmer_id,
+                org_data.get('name'),
+                org_data.get('type'),
+                org_data.get('countryCode'),
+                org_data.get('timeZone')
+            ))
 
-        cursor.execute('''
-            INSERT INTO organizations (org_id, farmer_id, name, type, country, time_zone, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            ON CONFLICT(org_id) DO UPDATE SET
-                farmer_id = excluded.farmer_id,
-                name = excluded.name,
-                type = excluded.type,
-                country = excluded.country,
-                time_zone = excluded.time_zone,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (
-            org_data.get('id'),
-            farmer_id,
-            org_data.get('name'),
-            org_data.get('type'),
-            org_data.get('countryCode'),
-            org_data.get('timeZone')
-        ))
-
-        conn.commit()
-        conn.close()
-
-    def upsert_field(self, org_id: str, field_data: Dict):
+    def upsert_organizations_bulk(self, farmer_id: str, orgs: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """Insert or update many organization records in a single transaction"""
+        rows = [
+            (
+                org_data.get('id'),
+                farmer_id,
+                org_data.get('name'),
+                org_data.get('type'),
+                org_data.get('countryCode'),
+                org_data.get('timeZone')
+            )
+            for org_data in orgs
+        ]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_UPSERT_ORGANIZATION, rows)
+
+    def upsert_field(self, org_id: str, field_data: Dict, conn: Optional[sqlite3.Connection] = None):
         """Insert or update a field record"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_UPSERT_FIELD, _field_row(org_id, field_data))
 
-        geometry_json = None
-        if 'boundaries' in field_data:
-            try:
-                geometry_json = json.dumps(field_data.get('boundaries'))
-            except Exception:
-                geometry_json = None
+    def upsert_fields_bulk(self, org_id: str, fields: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """Insert or update many field records of one organization in a single transaction"""
+        rows = [_field_row(org_id, field_data) for field_data in fields]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_UPSERT_FIELD, rows)
 
-        cursor.execute('''
-            INSERT INTO fields (field_id, org_id, name, external_id, area_ha, geometry_json, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            ON CONFLICT(field_id) DO UPDATE SET
-                org_id = excluded.org_id,
-                name = excluded.name,
-                external_id = excluded.external_id,
-                area_ha = excluded.area_ha,
-                geometry_json = excluded.geometry_json,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (
-            field_data.get('id'),
-            org_id,
-            field_data.get('name'),
-            field_data.get('externalId'),
-            field_data.get('area', {}).get('value') if isinstance(field_data.get('area'), dict) else None,
-            geometry_json
-        ))
-
-        conn.commit()
-        conn.close()
-
-
-    def fetch_all_normalized_operations(
+    def mark_fields_ops_synced(self, field_ids: List[str], conn: Optional[sqlite3.Connection] = None):
+        """Record that the farmer sync stored these fields' operations"""
+        now = datetime.now()
+        rows = [(now, field_id) for field_id in field_ids]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_MARK_FIELD_OPS_SYNCED, rows)
+
+    def get_ops_synced_fields(self, farmer_id: str) -> Set[Tuple[str, str]]:
+        """(org_id, field_id) of every field whose operations the farmer sync has stored"""
+        with self.reader() as conn:
+            return set(conn.execute(_SQL_GET_OPS_SYNCED_FIELDS, (farmer_id,)).fetchall())
+
+    def get_field_name(self, org_id: str, field_id: str) -> Optional[str]:
+        """Name of a stored field, or None if it isn't stored (or has no name)"""
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_FIELD_NAME, (field_id, org_id)).fetchone()
+        return row[0] if row else None
+
+    def get_org_and_field_names(self, org_id: str, field_id: str) -> Tuple[Optional[str], Optional[str]]:
+        """(org name, field name) of a stored field; (None, None) if it isn't stored"""
+        with self.reader() as conn:
+            row = conn.execute(_SQL_GET_ORG_AND_FIELD_NAMES, (field_id, org_id)).fetchone()
+        return row if row else (None, None)
+
+
+    def _query_normalized_operations(self, conn: sqlite3.Connection, org_id: Optional[str], field_id: Optional[str]) -> sqlite3.Cursor:
+        """Run the normalized-operations listing with optional org/field filters"""
+        sql = _SQL_LIST_NORMALIZED_OPERATIONS_BY_FILTER[(bool(org_id), bool(field_id))]
+        return conn.execute(sql, {"org_id": org_id, "field_id": field_id})
+
+    def fetch_normalized_operations_page(
         self,
         org_id: str | None = None,
         field_id: str | None = None,
-    ):
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[int, List[Dict]]:
         """
-        Return joined normalized operations with org & field names.
-        Optional filters: org_id, field_id.
+        Return (total matching, one page of) normalized operations with org
+        & field names. Optional filters: org_id, field_id.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        base_sql = """
-            SELECT
-              o.operation_id,
-              o.org_id,
-              org.name AS org_name,
-              o.field_id,
-              f.name AS field_name,
-              o.operation_type,
-              o.operation_date,
-              o.start_time,
-              o.end_time,
-              o.crop_name,
-              o.product_name,
-              o.product_category,
-              o.rate_value,
-              o.rate_unit,
-              o.total_amount,
-              o.total_amount_unit,
-              o.area_ha,
-              o.equipment_name,
-              o.notes
-            FROM operations_normalized o
-            LEFT JOIN fields f
-              ON o.field_id = f.field_id
-            LEFT JOIN organizations org
-              ON o.org_id = org.org_id
-        """
-
-        conditions = []
-        params = []
-
-        if org_id:
-            conditions.append("o.org_id = ?")
-            params.append(org_id)
-        if field_id:
-            conditions.append("o.field_id = ?")
-            params.append(field_id)
+        key = (bool(org_id), bool(field_id))
+        params = {"org_id": org_id, "field_id": field_id, "limit": limit, "offset": offset}
+        with self.reader() as conn:
+            total = conn.execute(_SQL_COUNT_NORMALIZED_OPERATIONS_BY_FILTER[key], params).fetchone()[0]
+            rows = _rows_as_dicts(conn.execute(_SQL_PAGE_NORMALIZED_OPERATIONS_BY_FILTER[key], params))
+        return total, rows
 
-        if conditions:
-            base_sql += " WHERE " + " AND ".join(conditions)
-
-        cursor.execute(base_sql, params)
-        rows = cursor.fetchall()
-        conn.close()
+    def iter_normalized_operations_raw(
+        self,
+        org_id: str | None = None,
+        field_id: str | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[list]:
+        """Stream normalized operations for CSV download (see _iter_batches)."""
+        return self._iter_batches(
+            lambda conn: self._query_normalized_operations(conn, org_id, field_id), batch_size
+        )
 
-        return [dict(r) for r in rows]
 
 
+    def get_field_boundary_summaries(self, org_id: str) -> List[Dict]:
+        """Per-field boundary count and active boundary, without loading the geometry"""
+        with self.reader() as conn:
+            return _rows_as_dicts(conn.execute(_SQL_FIELD_BOUNDARY_SUMMARIES, (org_id,)))
 
     def get_dashboard_summary(self):
         """
         Return basic counts and totals for the admin dashboard.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM organizations")
-        orgs_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM fields")
-        fields_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COALESCE(SUM(area_ha), 0) FROM fields")
-        total_area_ha = cursor.fetchone()[0] or 0
-
-        cursor.execute("SELECT COUNT(*) FROM operations_normalized")
-        operations_count = cursor.fetchone()[0]
-
-        conn.close()
+        with self.reader() as conn:
+            orgs_count, farmers_count, fields_count, total_area_ha, operations_count = (
+                conn.execute(_SQL_DASHBOARD_SUMMARY).fetchone()
+            )
 
         return {
             "organizations_count": orgs_count,
             "fields_count": fields_count,
-            "total_area_ha": total_area_ha,
+            "total_area_ha": total_area_ha or 0,
             "operations_count": operations_count,
+            "farmers_count": farmers_count,
         }
 
 
@@ -421,101 +989,93 @@ class Database:
 
     # ---------- NEW: Raw & Normalized Operations ----------
 
-    def upsert_raw_operation(self, org_id: str, field_id: str, operation: Dict):
+    def upsert_raw_operation(self, org_id: str, field_id: str, operation: Dict, conn: Optional[sqlite3.Connection] = None):
         """Store raw Deere operation JSON"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        op_id = operation.get('id')
-        start_ts = operation.get('startTime')
-        end_ts = operation.get('endTime')
-
-        cursor.execute('''
-            INSERT INTO operations_raw (operation_id, field_id, org_id, raw_json, event_start, event_end, ingested_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(operation_id) DO UPDATE SET
-                field_id = excluded.field_id,
-                org_id = excluded.org_id,
-                raw_json = excluded.raw_json,
-                event_start = excluded.event_start,
-                event_end = excluded.event_end,
-                ingested_at = CURRENT_TIMESTAMP
-        ''', (
-            op_id,
-            field_id,
-            org_id,
-            json.dumps(operation),
-            start_ts,
-            end_ts
-        ))
-
-        conn.commit()
-        conn.close()
-
-
-    def fetch_all_rows(self, table: str):
-        """Return all rows as list of dicts, for JSON view."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT * FROM {table}")
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(r) for r in rows]
-
-    def fetch_all_rows_raw(self, table: str) -> Tuple[List[str], List[tuple]]:
-        """Return (columns, rows) for CSV download."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT * FROM {table}")
-        cols = [d[0] for d in cursor.description]
-        rows = cursor.fetchall()
-        conn.close()
-        return cols, rows
-
-
-    def insert_normalized_operations(self, org_id: str, field_id: str, normalized_ops: List[Dict]):
-        """Bulk-insert normalized operations for one field"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        for op in normalized_ops:
-            cursor.execute('''
-                INSERT INTO operations_normalized (
-                    operation_id, field_id, org_id,
-                    operation_type, operation_date,
-                    start_time, end_time,
-                    crop_name, product_name, product_category,
-                    rate_value, rate_unit,
-                    total_amount, total_amount_unit,
-                    area_ha, equipment_name, notes,
-                    normalized_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                op.get('operation_id'),
+        with self._writer(conn) as conn:
+            conn.execute(_SQL_UPSERT_RAW_OPERATION, (
+                operation.get('id'),
                 field_id,
                 org_id,
-                op.get('operation_type'),
-                op.get('operation_date'),
-                op.get('start_time'),
-                op.get('end_time'),
-                op.get('crop_name'),
-                op.get('product_name'),
-                op.get('product_category'),
-                op.get('rate_value'),
-                op.get('rate_unit'),
-                op.get('total_amount'),
-                op.get('total_amount_unit'),
-                op.get('area_ha'),
-                op.get('equipment_name'),
-                op.get('notes'),
+                orjson.dumps(operation).decode(),
+                operation.get('startTime'),
+                operation.get('endTime')
             ))
 
-        conn.commit()
-        conn.close()
+    def upsert_raw_operations_bulk(self, org_id: str, field_id: str, operations: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """Store many raw Deere operations for one field in a single transaction"""
+        rows = [
+            (
+                op.get('id'),
+                field_id,
+                org_id,
+                orjson.dumps(op).decode(),
+                op.get('startTime'),
+                op.get('endTime')
+            )
+            for op in operations
+        ]
+        if not rows:
+            return
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_UPSERT_RAW_OPERATION, rows)
+
+
+    def fetch_rows_page(self, table: str, limit: int = 100, offset: int = 0) -> Tuple[int, List[Dict]]:
+        """Return (total rows, one page of rows as dicts), for JSON view."""
+        _select_all_sql(table)  # rejects unknown tables
+        with self.reader() as conn:
+            total = conn.execute(_SQL_COUNT_ALL[table]).fetchone()[0]
+            rows = _rows_as_dicts(conn.execute(_SQL_SELECT_PAGE[table], (limit, offset)))
+        return total, rows
+
+    def iter_all_rows_raw(self, table: str, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[list]:
+        """Stream every row of a table for CSV download (see _iter_batches)."""
+        return self._iter_batches(lambda conn: conn.execute(_select_all_sql(table)), batch_size)
+
+    def _iter_batches(self, query, batch_size: int) -> Iterator[list]:
+        """
+        Yield the column names of query(conn), then its rows in lists of up
+        to batch_size. Runs on its own connection, closed when the iterator
+        finishes or is closed, so a slow download doesn't hold a pooled reader.
+        """
+        conn = self._connect()
+        try:
+            cursor = query(conn)
+            yield [d[0] for d in cursor.description]
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            conn.close()
+
+
+    def insert_normalized_operations(self, org_id: str, field_id: str, normalized_ops: List[Dict], conn: Optional[sqlite3.Connection] = None):
+        """
+        Bulk-insert normalized operations for one field. Each dict must have
+        every operations_normalized key (as normalized_operation_row builds).
+        """
+        rows = [
+            (op['operation_id'], field_id, org_id) + _normalized_operation_values(op)
+            for op in normalized_ops
+        ]
+        if not rows:
+            return
+
+        # One prepared statement, one transaction for the whole batch
+        with self.transaction(conn) as conn:
+            conn.executemany(_SQL_INSERT_NORMALIZED_OPERATION, rows)
+
+
 
+# Global database instance, created on first use so importing this module
+# (every worker, script and test) doesn't open the file or run DDL
+_db: Optional[Database] = None
+_db_lock = threading.Lock()
 
 
-# Global database instance
-db = Database()
+def get_db() -> Database:
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = Database()
+    return _db
@@ -1,17 +1,78 @@
+import asyncio
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from operator import itemgetter
 import httpx
-from typing import List, Dict, Optional
+import ijson
+import orjson
+from cachetools import LRUCache
+from typing import List, Dict, Optional, Tuple
 from .config import settings
+from .logging_config import get_logger
 from .auth import auth
-from .database import db
-from app.models import NormalizedOperation
+from .database import get_db
+from app.models import NormalizedOperation, Organization, Farm, Field, Boundary
+
+logger = get_logger(__name__)
+
+# Bodies above this size are decoded in a worker thread so a multi-MB
+# field/operation listing doesn't stall the event loop
+OFFLOAD_DECODE_BYTES = 64 * 1024
+
+NEXT_PAGE_RELS = ('nextPage', 'next')
+
+# Conditional-GET entries kept per client: (user_id, url, params) -> (etag, body)
+ETAG_CACHE_SIZE = 1024
+
+# Cap on JDOC fan-out items in flight across all batches (fields/operations),
+# and the time limit for each page request, its 401 retry included
+MAX_CONCURRENT_REQUESTS = settings.JDOC_MAX_CONCURRENCY
+CALL_TIMEOUT_SECONDS = settings.JDOC_CALL_TIMEOUT_SECONDS
+
+# Shared by every gather_limited() call, so concurrent syncs together stay
+# under the cap instead of each getting MAX_CONCURRENT_REQUESTS of their own
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _next_page_uri(response: Dict) -> Optional[str]:
+    """URI of the next page of a JDOC collection response, if any"""
+    for link in response.get('links') or []:
+        if link.get('rel') in NEXT_PAGE_RELS:
+            return link.get('uri')
+    return None
+
 
 class JDOCClient:
     """Client for interacting with John Deere Operations Center API"""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            client: Optional pooled client to share (its base_url must be the
+                JDOC API); the caller then owns it and closes it
+        """
         self.base_url = settings.api_base_url
+        # One pooled client for every call so syncs reuse TLS connections
+        # (and multiplex over HTTP/2) instead of handshaking per request
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            # Fail fast on an unreachable host; reads of big pages keep 30 s
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Room for several concurrent fan-outs (MAX_CONCURRENT_REQUESTS each)
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30),
+        )
+        self._etag_cache = LRUCache(maxsize=ETAG_CACHE_SIZE)
+    
+    async def aclose(self):
+        """Close the pooled HTTP client, unless it was passed in"""
+        if self._owns_client:
+            await self._client.aclose()
     
-    async def _make_request(self, user_id: str, endpoint: str, method: str = "GET", **kwargs) -> Dict:
+    async def _make_request(self, user_id: str, endpoint: str, method: str = "GET", etag: bool = False, **kwargs) -> Dict:
         """
         Make authenticated request to JDOC API
         
@@ -19,6 +80,8 @@ class JDOCClient:
             user_id: User identifier
             endpoint: API endpoint (e.g., '/organizations')
             method: HTTP method
+            etag: Send If-None-Match from the last response for this URL and
+                reuse its body on a 304
             **kwargs: Additional arguments for httpx request
             
         Returns:
@@ -30,24 +93,129 @@ class JDOCClient:
             raise Exception("No valid access token available")
         
         headers = {
-            'Authorization': f'Bearer {access_token}',
             'Accept': 'application/vnd.deere.axiom.v3+json',
             **kwargs.pop('headers', {})
         }
         
-        url = f"{self.base_url}{endpoint}"
+        # Relative endpoints resolve against the client's base_url;
+        # pagination links come back as absolute URIs and pass through
+        url = endpoint
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(method, url, headers=headers, **kwargs)
+        cache_key = cached = None
+        if etag:
+            cache_key = (user_id, url, repr(kwargs.get('params')))
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers['If-None-Match'] = cached[0]
+        
+        async with asyncio.timeout(CALL_TIMEOUT_SECONDS):
+            response = await self._client.request(
+                method, url, headers={**headers, 'Authorization': f'Bearer {access_token}'}, **kwargs
+            )
             
             if response.status_code == 401:
-                raise Exception("Authentication failed - token may be invalid")
-            elif response.status_code == 403:
-                raise Exception("Access forbidden - check organization permissions")
-            elif response.status_code != 200:
-                raise Exception(f"API request failed: {response.status_code} - {response.text}")
+                # Token revoked or expired early: drop it, refresh once and retry
+                access_token = await auth.get_valid_token(user_id, rejected_token=access_token)
+                if access_token:
+                    response = await self._client.request(
+                        method, url, headers={**headers, 'Authorization': f'Bearer {access_token}'}, **kwargs
+                    )
+        
+        # Success (or a 304 for a body we already hold) is the common case;
+        # only walk the error cases (and read response.text) when it isn't
+        if response.status_code == 304 and cached is not None:
+            content = cached[1]
+        elif response.status_code == 200:
+            content = response.content
+            if cache_key is not None and response.headers.get('ETag'):
+                self._etag_cache[cache_key] = (response.headers['ETag'], content)
+        else:
+            self._raise_for_status(response)
+        
+        # Decode from bytes every time so callers never share a cached dict
+        if len(content) > OFFLOAD_DECODE_BYTES:
+            return await asyncio.to_thread(orjson.loads, content)
+        return orjson.loads(content)
+    
+    @staticmethod
+    def _raise_for_status(response: httpx.Response):
+        """Turn a non-200 JDOC response into the client's error messages"""
+        if response.status_code == 401:
+            raise Exception("Authentication failed - token may be invalid")
+        if response.status_code == 403:
+            raise Exception("Access forbidden - check organization permissions")
+        raise Exception(f"API request failed: {response.status_code} - {response.text}")
+    
+    async def _stream_values(self, user_id: str, endpoint: str, **kwargs):
+        """
+        Yield a JDOC collection's 'values' one at a time, parsing each page
+        incrementally as it downloads and following nextPage links.
+        Peak memory is one chunk plus the items not yet consumed, and the
+        event loop gets control back between chunks.
+        """
+        next_uri = endpoint
+        seen = set()
+        while next_uri and next_uri not in seen:
+            seen.add(next_uri)
+            access_token = await auth.get_valid_token(user_id)
+            if not access_token:
+                raise Exception("No valid access token available")
+            
+            values = ijson.sendable_list()
+            links = ijson.sendable_list()
+            values_parser = ijson.items_coro(values, 'values.item', use_float=True)
+            links_parser = ijson.items_coro(links, 'links.item')
+            
+            for attempt in range(2):
+                async with self._client.stream(
+                    'GET', next_uri,
+                    headers={'Accept': 'application/vnd.deere.axiom.v3+json', 'Authorization': f'Bearer {access_token}'},
+                    **kwargs
+                ) as response:
+                    if response.status_code == 401 and attempt == 0:
+                        # Same one-shot refresh and retry as _make_request
+                        access_token = await auth.get_valid_token(user_id, rejected_token=access_token)
+                        if access_token:
+                            continue
+                    if response.status_code != 200:
+                        await response.aread()
+                        self._raise_for_status(response)
+                    
+                    async for chunk in response.aiter_bytes():
+                        values_parser.send(chunk)
+                        links_parser.send(chunk)
+                        for item in values:
+                            yield item
+                        del values[:]
+                break
             
-            return response.json()
+            values_parser.close()
+            links_parser.close()
+            for item in values:
+                yield item
+            
+            # The next URI already carries the original query parameters
+            next_uri = _next_page_uri({'links': list(links)})
+            kwargs = {}
+    
+    async def _get_all_values(self, user_id: str, endpoint: str, etag: bool = False, **kwargs) -> List[Dict]:
+        """
+        GET a JDOC collection and follow its nextPage links until every
+        page's 'values' have been collected
+        """
+        response = await self._make_request(user_id, endpoint, etag=etag, **kwargs)
+        values = list(response.get('values', []))
+        
+        next_uri = _next_page_uri(response)
+        seen = set()
+        while next_uri and next_uri not in seen:
+            seen.add(next_uri)
+            # The next URI already carries the original query parameters
+            response = await self._make_request(user_id, next_uri, etag=etag)
+            values.extend(response.get('values', []))
+            next_uri = _next_page_uri(response)
+        
+        return values
     
     async def get_organizations(self, user_id: str) -> List[Dict]:
         """
@@ -56,13 +224,12 @@ class JDOCClient:
         Returns:
             List of organization dictionaries
         """
-        response = await self._make_request(user_id, '/organizations')
+        # Polled on every callback/dashboard load and rarely changes, so
+        # revalidate with the ETag instead of re-downloading
+        organizations = await self._get_all_values(user_id, '/organizations', etag=True)
         
-        organizations = response.get('values', [])
-        
-        # Save organizations to database
-        for org in organizations:
-            db.save_organization(user_id, org)
+        # Save organizations to database in one transaction, off the event loop
+        await asyncio.to_thread(get_db().save_organizations_bulk, user_id, organizations)
         
         return organizations
     
@@ -100,21 +267,36 @@ class JDOCClient:
         if include_boundaries:
             endpoint += '?embed=boundaries'
         
-        response = await self._make_request(user_id, endpoint)
+        return await self._get_all_values(user_id, endpoint)
+    
+    async def get_field(self, user_id: str, org_id: str, field_id: str) -> Dict:
+        """
+        Get a single field (without boundaries)
         
-        # TEMP DEBUG: log Deere pagination links
-        print(f"[DEBUG] get_fields: org_id={org_id}, links={response.get('links')}")
-        fields = response.get('values', [])
-        print(f"[DEBUG] get_fields: received {len(fields)} fields for org_id={org_id}")
-        # TEMP DEBUG
-        print(f"[DEBUG] get_fields: received {len(fields)} fields for org_id={org_id}")
-
-
-        return response.get('values', [])
- 
+        Returns:
+            Field dictionary
+        """
+        return await self._make_request(user_id, f'/organizations/{org_id}/fields/{field_id}')
     
-       
-
+    async def get_fields_many(self, user_id: str, org_ids: List[str], include_boundaries: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Get fields for several organizations concurrently
+        
+        Returns:
+            Dict mapping org_id -> list of field dictionaries.
+            Orgs whose request failed are logged and left out.
+        """
+        results = await self.gather_limited(
+            [self.get_fields(user_id, org_id, include_boundaries=include_boundaries) for org_id in org_ids]
+        )
+        
+        fields_by_org = {}
+        for org_id, result in zip(org_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching fields for org {org_id}: {result}")
+                continue
+            fields_by_org[org_id] = result
+        return fields_by_org
    
     async def get_field_operations(
         self, 
@@ -145,8 +327,92 @@ class JDOCClient:
         if end_date:
             params['endDate'] = end_date
         
-        response = await self._make_request(user_id, endpoint, params=params)
-        return response.get('values', [])
+        return await self._get_all_values(user_id, endpoint, params=params)
+    
+    async def iter_field_operations(
+        self,
+        user_id: str,
+        org_id: str,
+        field_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ):
+        """
+        Streaming variant of get_field_operations: an async generator that
+        yields operations as they are parsed off the wire, for callers that
+        process operations one at a time
+        """
+        endpoint = f'/organizations/{org_id}/fields/{field_id}/fieldOperations'
+        
+        params = {}
+        if start_date:
+            params['startDate'] = start_date
+        if end_date:
+            params['endDate'] = end_date
+        
+        async for operation in self._stream_values(user_id, endpoint, params=params):
+            yield operation
+    
+    async def get_all_field_operations(
+        self,
+        user_id: str,
+        org_field_pairs: List[Tuple[str, str]],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        date_ranges: Optional[Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]]] = None,
+        failures: Optional[Dict[Tuple[str, str], Exception]] = None
+    ) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Get field operations for many (org_id, field_id) pairs concurrently
+        
+        Args:
+            date_ranges: Optional per-pair (start_date, end_date) overriding
+                start_date/end_date, e.g. for incremental syncs
+            failures: If given, filled with pair -> exception for the pairs
+                left out of the result
+        
+        Returns:
+            Dict mapping (org_id, field_id) -> list of operations.
+            Pairs whose request failed are logged and left out.
+        """
+        date_ranges = date_ranges or {}
+        results = await self.gather_limited([
+            self.get_field_operations(
+                user_id, org_id, field_id,
+                *date_ranges.get((org_id, field_id), (start_date, end_date))
+            )
+            for org_id, field_id in org_field_pairs
+        ])
+        
+        operations = {}
+        for pair, result in zip(org_field_pairs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching operations for field {pair[1]}, org {pair[0]}: {result!r}")
+                if failures is not None:
+                    failures[pair] = result
+                continue
+            operations[pair] = result
+        return operations
+    
+    async def gather_limited(self, coros: list) -> list:
+        """
+        gather() with at most MAX_CONCURRENT_REQUESTS items running across
+        all callers; exceptions (TimeoutError for a page that took longer
+        than CALL_TIMEOUT_SECONDS) are returned, not raised (except
+        cancellation). Items must not call gather_limited themselves.
+        """
+        async def run(coro):
+            async with _request_semaphore:
+                return await coro
+        
+        results = await asyncio.gather(*[run(c) for c in coros], return_exceptions=True)
+        # return_exceptions hands back a cancelled task's CancelledError as a
+        # result too; propagate it so cancellation (e.g. client disconnect)
+        # unwinds instead of being mistaken for data
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+        return results
 
 # Global JDOC client instance
 jdoc_client = JDOCClient()
@@ -158,42 +424,59 @@ jdoc_client = JDOCClient()
 # HELPER FUNCTION: Normalize JDOC Operations
 # ============================================
 
+# datetime.fromisoformat only understands a trailing "Z" from 3.11 on
+ISO_NEEDS_Z_FIX = sys.version_info < (3, 11)
+
+# Deere fieldOperationType -> AgriCapture operation_type (anything else is OTHER)
+OPERATION_TYPE_MAP = {
+    "seeding": "PLANTING",
+    "harvest": "HARVEST",
+    "tillage": "TILLAGE",
+    "application": "FERTILIZER",
+}
+
 def normalize_operation(
     raw_operation: dict,
     field_id: str,
     field_name: str,
     org_id: str,
     org_name: str,
-) -> "NormalizedOperation":
+) -> NormalizedOperation:
+    """Convert a raw JDOC FieldOperation into a NormalizedOperation (see normalize_operation_dict)"""
+    return NormalizedOperation(**normalize_operation_dict(
+        raw_operation, field_id, field_name, org_id, org_name
+    ))
+
+
+def normalize_operation_dict(
+    raw_operation: dict,
+    field_id: str,
+    field_name: str,
+    org_id: str,
+    org_name: str,
+) -> Dict:
     """
-    Convert a raw JDOC FieldOperation into AgriCapture's normalized format.
+    Convert a raw JDOC FieldOperation into AgriCapture's normalized format,
+    as the plain dict NormalizedOperation(...).model_dump() would give, for
+    the paths that only need dicts (no model validation per operation).
     Uses Deere's FieldOperation shape:
     - fieldOperationType: seeding / harvest / tillage / application / ...
     - cropName, varieties, tillageProducts, startDate, endDate, etc.
     """
-    from app.models import NormalizedOperation
-    from datetime import datetime
+    # Bound once: this runs for every operation in a sync
+    get = raw_operation.get
 
     # --- 1) Operation type mapping ---
 
     # Deere field name from your data: "fieldOperationType"
-    field_op_type = raw_operation.get("fieldOperationType")
-
-    if field_op_type == "seeding":
-        operation_type = "PLANTING"
-    elif field_op_type == "harvest":
-        operation_type = "HARVEST"
-    elif field_op_type == "tillage":
-        operation_type = "TILLAGE"
-    elif field_op_type == "application":
-        operation_type = "FERTILIZER"
-    else:
-        operation_type = "OTHER"
+    field_op_type = get("fieldOperationType")
+
+    operation_type = OPERATION_TYPE_MAP.get(field_op_type, "OTHER")
 
     # --- 2) Date / time ---
 
-    start_iso = raw_operation.get("startDate")  # e.g. "2020-04-22T02:00:41.212Z"
-    end_iso = raw_operation.get("endDate")
+    start_iso = get("startDate")  # e.g. "2020-04-22T02:00:41.212Z"
+    end_iso = get("endDate")
 
     # Choose a main date (start if available, else end)
     date_value = start_iso or end_iso
@@ -201,9 +484,11 @@ def normalize_operation(
     # Try to convert ISO string to datetime; fall back to now
     date_parsed = None
     if date_value and isinstance(date_value, str):
+        if ISO_NEEDS_Z_FIX and date_value.endswith("Z"):
+            date_value = date_value[:-1] + "+00:00"
         try:
-            date_parsed = datetime.fromisoformat(date_value.replace("Z", "+00:00"))
-        except Exception:
+            date_parsed = datetime.fromisoformat(date_value)
+        except ValueError:
             date_parsed = datetime.utcnow()
     else:
         date_parsed = datetime.utcnow()
@@ -211,62 +496,226 @@ def normalize_operation(
     # --- 3) Crop and product names ---
 
     # Deere uses "cropName" for seeding/harvest in your sample
-    crop_name = raw_operation.get("cropName")
+    crop_name = get("cropName")
 
     product_name = None
     product_category = None
 
-    # Deere seeding/harvest uses "varieties": [ { name, productType, ... } ]
-    varieties = raw_operation.get("varieties") or []
-    if varieties and isinstance(varieties, list):
-        first_var = varieties[0]
-        if isinstance(first_var, dict):
-            product_name = first_var.get("name")
-            product_category = first_var.get("productType")  # e.g. "SEED"
+    # Deere seeding/harvest uses "varieties": [ { name, productType, ... } ].
+    # EAFP: well-formed payloads skip the type checks; missing, empty or
+    # oddly shaped values just leave the names unset.
+    try:
+        first_var = get("varieties")[0]
+        product_name = first_var.get("name")
+        product_category = first_var.get("productType")  # e.g. "SEED"
+    except (TypeError, IndexError, KeyError, AttributeError):
+        pass
 
     # Tillage has "tillageProducts": [ { tillageType } ]
     tillage_detail = None
-    tillage_products = raw_operation.get("tillageProducts") or []
-    if tillage_products and isinstance(tillage_products, list):
-        first_tillage = tillage_products[0]
-        if isinstance(first_tillage, dict):
-            tillage_detail = first_tillage.get("tillageType")
+    try:
+        tillage_detail = get("tillageProducts")[0].get("tillageType")
+    except (TypeError, IndexError, KeyError, AttributeError):
+        pass
 
     # --- 4) Area, rate, amount (still minimal for now) ---
 
     area = None
     area_unit = None
     if "area" in raw_operation:
-        area_obj = raw_operation.get("area") or {}
+        area_obj = get("area") or {}
         if isinstance(area_obj, dict):
-            area = area_obj.get("valueAsDouble") or area_obj.get("value")
-            area_unit = area_obj.get("unit") or "ha"
+            area_get = area_obj.get
+            area = area_get("valueAsDouble") or area_get("value")
+            area_unit = area_get("unit") or "ha"
+            if area is not None:
+                area = float(area)
 
     # Your current sample normalized output has amount/rate null; keep it that way for now.
     amount = None
     rate = None
     rate_unit = None
 
-    # --- 5) Build and return NormalizedOperation model ---
-
-    return NormalizedOperation(
-        field_id=field_id,
-        field_name=field_name,
-        org_id=org_id,
-        org_name=org_name,
-        operation_type=operation_type,
-        date=date_parsed,
-        crop_name=crop_name,
-        product_name=product_name,
-        amount=amount,
-        rate=rate,
-        rate_unit=rate_unit,
-        area=area,
-        area_unit=area_unit,
-        raw_jdoc_data=raw_operation,  # Keep original for debugging
+    # --- 5) Build and return the NormalizedOperation fields ---
+
+    return {
+        "operation_id": get("id"),
+        "field_id": field_id,
+        "field_name": field_name,
+        "org_id": org_id,
+        "org_name": org_name,
+        "operation_type": operation_type,
+        "date": date_parsed,
+        "crop_name": crop_name,
+        "product_name": product_name,
+        "amount": amount,
+        "rate": rate,
+        "rate_unit": rate_unit,
+        "area": area,
+        "area_unit": area_unit,
+        # Pinning the whole raw dict per op doubles memory on big exports
+        "raw_jdoc_data": raw_operation if settings.DEBUG else None,
+    }
+
+
+def normalized_operation_row(normalized: Dict) -> Dict:
+    """operations_normalized row for a normalize_operation_dict result"""
+    op_date = normalized["date"]
+    return {
+        "operation_id": normalized["operation_id"] or f"{normalized['field_id']}-{op_date}",
+        "field_id": normalized["field_id"],
+        "org_id": normalized["org_id"],
+        "operation_type": normalized["operation_type"],
+        "operation_date": op_date,
+        "start_time": op_date,
+        "end_time": op_date,
+        "crop_name": normalized["crop_name"],
+        "product_name": normalized["product_name"],
+        "product_category": None,
+        "rate_value": normalized["rate"],
+        "rate_unit": normalized["rate_unit"],
+        "total_amount": normalized["amount"],
+        "total_amount_unit": None,
+        "area_ha": normalized["area"],
+        "equipment_name": None,
+        "notes": None,
+        "org_name": normalized["org_name"],
+        "field_name": normalized["field_name"],
+    }
+
+
+def normalize_operations_bulk(
+    raw_operations: List[Dict],
+    field_id: str,
+    field_name: str,
+    org_id: str,
+    org_name: str
+) -> Tuple[List[Dict], List[Tuple[Optional[str], str]]]:
+    """
+    One field's operations straight to operations_normalized rows, plus
+    (operation id, error) pairs for the ones that failed to normalize
+    """
+    rows = []
+    failures = []
+    for raw_op in raw_operations:
+        try:
+            rows.append(normalized_operation_row(normalize_operation_dict(
+                raw_op, field_id, field_name, org_id, org_name
+            )))
+        except Exception as e:
+            failures.append((raw_op.get("id"), str(e)))
+    return rows, failures
+
+
+# Fields with at least this many operations are normalized in a worker
+# process; below that the pickling round trip costs more than it saves.
+# With fewer than two workers configured the pool is never used.
+NORMALIZE_POOL_MIN_OPS = 2000
+NORMALIZE_POOL_WORKERS = settings.NORMALIZE_POOL_WORKERS
+
+_normalize_pool: Optional[ProcessPoolExecutor] = None
+
+
+def normalize_operations_batch(
+    raw_operations: List[Dict],
+    field_id: str,
+    field_name: str,
+    org_id: str,
+    org_name: str
+) -> Tuple[List[NormalizedOperation], List[Tuple[Optional[str], str]]]:
+    """
+    normalize_operation over one field's operations. Failures come back as
+    (operation id, error) pairs rather than being logged, because this also
+    runs in worker processes whose log records would never reach the app's
+    handlers.
+
+    The models are built with model_construct: normalize_operation_dict
+    already produces correctly typed values, so per-op validation is skipped.
+    """
+    # The per-field names are the only values that don't come from the
+    # normalizer; make sure they are strings once, here, instead of per op
+    field_name = field_name or field_id
+    org_name = org_name or org_id
+    construct = NormalizedOperation.model_construct
+    
+    normalized = []
+    failures = []
+    for raw_op in raw_operations:
+        try:
+            normalized.append(construct(**normalize_operation_dict(
+                raw_op, field_id, field_name, org_id, org_name
+            )))
+        except Exception as e:
+            failures.append((raw_op.get("id"), str(e)))
+    return normalized, failures
+
+
+async def normalize_operations(
+    raw_operations: List[Dict],
+    field_id: str,
+    field_name: str,
+    org_id: str,
+    org_name: str
+) -> List[NormalizedOperation]:
+    """
+    Normalize one field's operations, on a worker process for large batches
+    so the CPU work runs on other cores while the event loop keeps serving
+    requests. Operations that fail to normalize are logged and skipped.
+    """
+    args = (raw_operations, field_id, field_name, org_id, org_name)
+    if _normalize_pool is None or len(raw_operations) < NORMALIZE_POOL_MIN_OPS:
+        normalized, failures = normalize_operations_batch(*args)
+    else:
+        loop = asyncio.get_running_loop()
+        normalized, failures = await loop.run_in_executor(_normalize_pool, normalize_operations_batch, *args)
+    
+    for op_id, error in failures:
+        logger.warning("Error normalizing operation %s: %s", op_id, error)
+    return normalized
+
+
+def start_normalize_pool():
+    """
+    Create the normalization worker pool (call on app startup). Workers
+    come from a forkserver rather than being forked from the server, whose
+    other threads may hold locks (DB writer, logging) at fork time.
+    """
+    global _normalize_pool
+    if _normalize_pool is None and NORMALIZE_POOL_WORKERS >= 2:
+        _normalize_pool = ProcessPoolExecutor(
+            max_workers=NORMALIZE_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+
+def shutdown_normalize_pool():
+    """Stop the normalization worker processes, if any were started"""
+    global _normalize_pool
+    if _normalize_pool is not None:
+        _normalize_pool.shutdown(cancel_futures=True)
+        _normalize_pool = None
+
+
+def _build_boundary(boundary_raw: dict) -> Boundary:
+    """Leaf-like Boundary from a raw JDOC boundary"""
+    return Boundary(
+        id=boundary_raw.get("id", "unknown"),
+        name=boundary_raw.get("name"),
+        geometry=extract_geojson(boundary_raw),
+        area=extract_area(boundary_raw),
+        area_unit="ha",
+        active=boundary_raw.get("active", True)
     )
 
 
+def _build_field(field_id: str, field_raw: dict, operations_normalized: dict) -> Field:
+    """Leaf-like Field with its boundaries and already-normalized operations"""
+    return Field(
+        id=field_id,
+        name=field_raw.get("name", field_id),
+        boundaries=[_build_boundary(b) for b in field_raw.get("boundaries") or ()],
+        operations=operations_normalized.get(field_id, [])
+    )
 
 
 def build_leaf_like_hierarchy(
@@ -287,8 +736,6 @@ def build_leaf_like_hierarchy(
     Returns:
         List of Organization objects in Leaf-like format
     """
-    from app.models import Organization, Farm, Field, Boundary, NormalizedOperation
-    
     orgs_list = []
     
     for org_raw in organizations_raw:
@@ -303,37 +750,12 @@ def build_leaf_like_hierarchy(
         default_farm = Farm(
             id=f"{org_id}-farm-default",
             name=f"{org_name} Farm",
-            fields=[]
+            fields=[
+                _build_field(field_id, field_raw, operations_normalized)
+                for field_id, field_raw in fields_for_org.items()
+            ]
         )
         
-        for field_id, field_raw in fields_for_org.items():
-            # Build boundaries for this field
-            boundaries = []
-            if "boundaries" in field_raw:
-                for boundary_raw in field_raw.get("boundaries", []):
-                    boundary = Boundary(
-                        id=boundary_raw.get("id", "unknown"),
-                        name=boundary_raw.get("name"),
-                        geometry=extract_geojson(boundary_raw),  # Will define this next
-                        area=extract_area(boundary_raw),
-                        area_unit="ha",
-                        active=boundary_raw.get("active", True)
-                    )
-                    boundaries.append(boundary)
-            
-            # Get operations for this field
-            field_operations = operations_normalized.get(field_id, [])
-            
-            # Build field object
-            field = Field(
-                id=field_id,
-                name=field_raw.get("name", field_id),
-                boundaries=boundaries,
-                operations=field_operations
-            )
-            
-            default_farm.fields.append(field)
-        
         # Build organization object
         org = Organization(
             id=org_id,
@@ -347,36 +769,45 @@ def build_leaf_like_hierarchy(
     return orgs_list
 
 
+# [lon, lat] of a JDOC point, as a tuple: boundaries hold ~1M points on a
+# large farmer, and tuples of floats are untracked by the cyclic GC
+# where lists would make every collection during the build rescan them
+_point_lon_lat = itemgetter("lon", "lat")
+
+
 def extract_geojson(boundary_raw: dict) -> Optional[dict]:
     """Extract GeoJSON geometry from JDOC boundary"""
-    if "multipolygons" in boundary_raw:
-        # JDOC uses multipolygons with points
-        multipolygons = boundary_raw.get("multipolygons", [])
-        if multipolygons:
-            polygon = multipolygons[0]
-            if "rings" in polygon:
-                rings = polygon.get("rings", [])
-                if rings:
-                    ring = rings[0]
-                    points = ring.get("points", [])
-                    # Convert points to GeoJSON coordinate format [lon, lat]
-                    coordinates = [
-                        [point.get("lon"), point.get("lat")] 
-                        for point in points
-                    ]
-                    return {
-                        "type": "Polygon",
-                        "coordinates": [coordinates]
-                    }
+    # JDOC uses multipolygons with points; walk multipolygons[0].rings[0]
+    # with one lookup per level
+    multipolygons = boundary_raw.get("multipolygons")
+    if not multipolygons:
+        return None
+    rings = multipolygons[0].get("rings")
+    if not rings:
+        return None
+    points = rings[0].get("points", [])
     
-    return None
+    # Convert points to GeoJSON coordinate format [lon, lat] (tuples
+    # serialize as the same JSON arrays). Plain indexing is the fast path
+    # for large rings; fall back to .get only if some point is missing a
+    # coordinate.
+    try:
+        coordinates = list(map(_point_lon_lat, points))
+    except KeyError:
+        coordinates = [
+            (point.get("lon"), point.get("lat"))
+            for point in points
+        ]
+    return {
+        "type": "Polygon",
+        "coordinates": [coordinates]
+    }
 
 
 def extract_area(boundary_raw: dict) -> Optional[float]:
     """Extract area from JDOC boundary"""
-    if "area" in boundary_raw:
-        area_obj = boundary_raw.get("area", {})
-        if isinstance(area_obj, dict):
-            return area_obj.get("valueAsDouble")
+    area_obj = boundary_raw.get("area")
+    if isinstance(area_obj, dict):
+        return area_obj.get("valueAsDouble")
     
     return None
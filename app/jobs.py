@@ -0,0 +1,85 @@
+import asyncio
+import secrets
+from datetime import datetime, timezone
+from typing import Any, Coroutine, Dict, Optional, Set
+from cachetools import TTLCache
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Finished jobs are kept this long for polling; the cap bounds memory
+JOB_TTL_SECONDS = 3600
+JOBS_MAX = 256
+
+# Jobs allowed to run at once; submits beyond it are refused
+JOBS_MAX_RUNNING = 16
+
+
+class JobRegistry:
+    """
+    Long-running work run as background tasks on this process's event
+    loop, polled by id. Running jobs are kept until they finish; finished
+    ones for JOB_TTL_SECONDS. State lives in memory, so with several
+    workers a job can only be polled on the worker that started it, and it
+    doesn't survive a restart.
+    """
+
+    def __init__(self):
+        # job_id -> {"status": "running", ...}; never evicted while running
+        self._running: Dict[str, Dict] = {}
+        # job_id -> {"status": "done" | "failed", ...}; the TTL starts when
+        # the job finishes
+        self._finished = TTLCache(maxsize=JOBS_MAX, ttl=JOB_TTL_SECONDS)
+        # Strong references, so running tasks aren't garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def full(self) -> bool:
+        """True when JOBS_MAX_RUNNING jobs are already running"""
+        return len(self._running) >= JOBS_MAX_RUNNING
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> str:
+        """Start coro in the background and return its job id (RuntimeError if full)"""
+        if self.full:
+            coro.close()
+            raise RuntimeError("Too many jobs running")
+        job_id = secrets.token_urlsafe(12)
+        self._running[job_id] = {
+            "status": "running",
+            "created_at": datetime.now(timezone.utc),
+        }
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(lambda task: self._finish(job_id, task))
+        return job_id
+
+    def _finish(self, job_id: str, task: asyncio.Task):
+        self._tasks.discard(task)
+        job = self._running.pop(job_id)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Job %s failed", job_id, exc_info=error)
+            job.update(status="failed", error=str(getattr(error, "detail", error)))
+        else:
+            job.update(status="done", result=task.result())
+        job["finished_at"] = datetime.now(timezone.utc)
+        self._finished[job_id] = job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """The job's state, or None if it is unknown or has expired"""
+        job = self._running.get(job_id)
+        if job is None:
+            job = self._finished.get(job_id)
+        return job
+
+    async def aclose(self):
+        """Cancel jobs still running"""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+# Global job registry instance
+jobs = JobRegistry()
@@ -1,6 +1,8 @@
-import json
+import atexit
+import orjson
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 import uuid
 
@@ -8,8 +10,16 @@ class CustomJsonFormatter(logging.Formatter):
     """Format logs as JSON for structured logging"""
     
     def format(self, record):
+        # The file and console handlers share this formatter, so the second
+        # handler reuses the line the first one built for the same record
+        attrs = record.__dict__
+        cached = attrs.get('_json_line')
+        if cached is not None:
+            return cached
+        
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # record.created is stamped by logging already; no second clock read
+            "timestamp": datetime.utcfromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -19,17 +29,33 @@ class CustomJsonFormatter(logging.Formatter):
         }
         
         # Add request_id if available in the record
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
+        request_id = attrs.get('request_id')
+        if request_id is not None:
+            log_data['request_id'] = request_id
         
         # Add any extra fields
-        if hasattr(record, 'extra'):
-            log_data.update(record.extra)
+        extra = attrs.get('extra')
+        if extra:
+            log_data.update(extra)
         
-        return json.dumps(log_data)
+        # orjson writes the naive UTC timestamp as ISO 8601 with a Z suffix;
+        # default=str keeps odd extra values from breaking the log line
+        line = orjson.dumps(
+            log_data,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+            default=str,
+        ).decode()
+        attrs['_json_line'] = line
+        return line
 
 def setup_logging():
-    """Configure structured JSON logging to both file and console"""
+    """
+    Configure structured JSON logging to both file and console.
+    
+    Records are formatted on the calling thread, but the file/console
+    writes happen on a QueueListener thread so a burst of log lines never
+    blocks the event loop on I/O.
+    """
     
     # Root logger
     root_logger = logging.getLogger()
@@ -46,13 +72,24 @@ def setup_logging():
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(json_formatter)
-    root_logger.addHandler(file_handler)
     
     # Console handler (for CloudWatch pickup)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(json_formatter)
-    root_logger.addHandler(console_handler)
+    
+    # The queue handler formats with the same formatter, which caches the
+    # JSON line on the record; the listener's handlers reuse it as is
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    queue_handler.setFormatter(json_formatter)
+    root_logger.addHandler(queue_handler)
+    
+    listener = QueueListener(
+        queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(listener.stop)
     
     return root_logger
 
@@ -1,27 +1,35 @@
 from fastapi import FastAPI, Request, HTTPException, Query
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, StreamingResponse, Response
+from pydantic_core import to_json
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from typing import Optional
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import orjson
+import asyncio
 import secrets
 from .config import settings
-from .auth import auth
-from .database import db
-from .jdoc_api import jdoc_client
+from .auth import auth, oauth_states
+from .database import get_db, jdoc_timestamp, ADMIN_TABLES
+from .jdoc_api import (
+    jdoc_client, start_normalize_pool, shutdown_normalize_pool, normalize_operations, normalize_operation_dict,
+    normalize_operations_bulk, normalized_operation_row, build_leaf_like_hierarchy,
+)
+from .cache import fields_cache, organizations_cache
+from .jobs import jobs
 from .models import NormalizedOperation
 
 
 import logging
 import uuid
-from datetime import datetime
-from fastapi import FastAPI, Request
+from itertools import count
+from datetime import datetime, timezone
 from app.logging_config import setup_logging, get_logger
 from app.s3_storage import save_deere_data_to_s3, list_s3_files
 
-import sqlite3
 import io
 import csv
+import hashlib
 import pathlib
 
 
@@ -31,52 +39,93 @@ import pathlib
 setup_logging()
 logger = get_logger(__name__)
 
-app = FastAPI(title="AgriCapture JDOC Integration")
-
-# Middleware to add request ID
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
+# Explicit ORJSONResponse returns below skip FastAPI's jsonable_encoder walk
+# on the large payloads; the default class covers everything else
+app = FastAPI(title="AgriCapture JDOC Integration", default_response_class=ORJSONResponse)
+
+# Request IDs: a random per-process prefix keeps them unique across
+# workers, instances and restarts; the counter avoids an os.urandom
+# read on every request
+_REQUEST_ID_PREFIX = uuid.uuid4().hex[:12]
+_request_counter = count(1)
+
+# Middleware to add request ID. Plain ASGI rather than @app.middleware("http"):
+# BaseHTTPMiddleware adds an extra task and stream bridge to every request.
+class RequestIDMiddleware:
+    def __init__(self, app):
+        self.app = app
     
-    # Log request start
-    logger.info(
-        f"Request started: {request.method} {request.url.path}",
-        extra={"extra": {"request_id": request_id}}
-    )
-    
-    try:
-        response = await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        # %-style args: logging only builds the message if a handler emits it
+        method = scope["method"]
+        path = scope["path"]
+        log_extra = {"extra": {"request_id": request_id}}
+        status_code = None
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        # Log request start
+        logger.info("Request started: %s %s", method, path, extra=log_extra)
+        
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as e:
+            logger.error(
+                "Request failed: %s", e,
+                extra=log_extra,
+                exc_info=True
+            )
+            raise
         logger.info(
-            f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-            extra={"extra": {"request_id": request_id}}
-        )
-        return response
-    except Exception as e:
-        logger.error(
-            f"Request failed: {str(e)}",
-            extra={"extra": {"request_id": request_id}},
-            exc_info=True
+            "Request completed: %s %s - %s", method, path, status_code,
+            extra=log_extra
         )
-        raise
 
-# Health check endpoint (required by Docker)
+
+app.add_middleware(RequestIDMiddleware)
+
+# Health check endpoint (required by Docker, also used for monitoring)
 @app.get("/health")
 async def health_check():
-    logger.info("Health check requested")
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.utcnow().isoformat(),
+        "environment": settings.ENVIRONMENT,
+        "api_base": settings.api_base_url
     }
 
+
+@app.on_event("startup")
+async def start_worker_pools():
+    """Start the normalization worker processes before serving requests"""
+    start_normalize_pool()
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close long-lived HTTP clients and worker processes on shutdown"""
+    await auth.aclose()
+    await oauth_states.aclose()
+    await jdoc_client.aclose()
+    await jobs.aclose()
+    shutdown_normalize_pool()
+
 ##
 
 
 templates = Jinja2Templates(directory="templates")
 
-# In-memory state storage (in production, use Redis or database)
-oauth_states = {}
-
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page"""
@@ -95,7 +144,7 @@ async def login(farmer_id: Optional[str] = Query(None)):
     """
     # Generate state for CSRF protection
     state = secrets.token_urlsafe(32)
-    oauth_states[state] = {"farmer_id": farmer_id or "anonymous"}
+    await oauth_states.put(state, {"farmer_id": farmer_id or "anonymous"})
     
     # Generate authorization URL
     auth_url, _ = auth.generate_authorization_url(state)
@@ -113,16 +162,16 @@ async def callback(
     """
     # Handle errors
     if error:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"error": error, "message": "Authorization failed"}
         )
     
     # Verify state (CSRF protection)
-    if not state or state not in oauth_states:
+    farmer_info = await oauth_states.pop(state) if state else None
+    if farmer_info is None:
         raise HTTPException(status_code=400, detail="Invalid state parameter")
     
-    farmer_info = oauth_states.pop(state)
     farmer_id = farmer_info.get("farmer_id")
     
     if not code:
@@ -133,9 +182,9 @@ async def callback(
         token_data = await auth.exchange_code_for_token(code)
         
         # Save tokens to database
-        db.save_token(farmer_id, token_data)
+        await auth.save_token(farmer_id, token_data)
         # Ensure farmer exists in farmers table
-        db.upsert_farmer(farmer_id, name=f"Farmer {farmer_id}")
+        get_db().upsert_farmer(farmer_id, name=f"Farmer {farmer_id}")
 
         
         # Check if user needs to enable organization connections
@@ -151,7 +200,7 @@ async def callback(
         return RedirectResponse(url=f"/auth/success?farmer_id={farmer_id}")
         
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e), "message": "Failed to complete authorization"}
         )
@@ -159,7 +208,7 @@ async def callback(
 @app.get("/auth/connected")
 async def connected():
     """User is redirected here after enabling organization connections"""
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "success",
         "message": "Organizations connected successfully",
         "next_steps": "You can now access your field data through AgriCapture"
@@ -168,7 +217,7 @@ async def connected():
 @app.get("/auth/success")
 async def success(farmer_id: str = Query(...)):
     """Success page after complete authentication"""
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "success",
         "message": "Authentication completed successfully",
         "farmer_id": farmer_id,
@@ -177,21 +226,30 @@ async def success(farmer_id: str = Query(...)):
 
 
 
+base_dir = pathlib.Path(__file__).resolve().parent.parent  # /opt/deere-connector
+
+# The admin page doesn't change while the app runs: read it (and hash it for
+# the ETag) once at import instead of on every /admin hit
+try:
+    _ADMIN_HTML = (base_dir / "frontend" / "index.html").read_bytes()
+    _ADMIN_ETAG = f'"{hashlib.blake2b(_ADMIN_HTML, digest_size=8).hexdigest()}"'
+except OSError:
+    _ADMIN_HTML = None
+    _ADMIN_ETAG = None
+
+
 @app.get("/admin", response_class=HTMLResponse)
-async def admin_ui():
+async def admin_ui(request: Request):
     """
     Serve the admin dashboard UI.
     """
-    base_dir = pathlib.Path(__file__).resolve().parent.parent  # /opt/deere-connector
-    index_path = base_dir / "frontend" / "index.html"
-    try:
-        html = index_path.read_text(encoding="utf-8")
-    except Exception:
+    if _ADMIN_HTML is None:
         return HTMLResponse("<h1>Admin UI not found</h1>", status_code=500)
-    return HTMLResponse(content=html, status_code=200)
-
+    headers = {"ETag": _ADMIN_ETAG}
+    if request.headers.get("if-none-match") == _ADMIN_ETAG:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=_ADMIN_HTML, status_code=200, headers=headers)
 
-base_dir = pathlib.Path(__file__).resolve().parent.parent  # /opt/deere-connector
 
 app.mount(
     "/admin-static",
@@ -211,7 +269,7 @@ async def list_farmers() -> list[dict]:
     """
     List farmers from the local SQLite 'farmers' table.
     """
-    return db.get_all_farmers()
+    return get_db().get_all_farmers()
 
 
 
@@ -227,8 +285,8 @@ async def list_organizations(farmer_id: str = Query(...)):
         List of organizations
     """
     try:
-        organizations = await jdoc_client.get_organizations(farmer_id)
-        return {"organizations": organizations, "count": len(organizations)}
+        organizations = await organizations_cache.get_organizations(farmer_id)
+        return ORJSONResponse({"organizations": organizations, "count": len(organizations)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -239,8 +297,8 @@ async def sync_organizations_to_db(farmer_id: str = Query(...)):
     """
     try:
         orgs = await jdoc_client.get_organizations(farmer_id)
-        for org in orgs:
-            db.upsert_organization(farmer_id, org)
+        organizations_cache.store(farmer_id, orgs)
+        await asyncio.to_thread(get_db().upsert_organizations_bulk, farmer_id, orgs)
 
         return {
             "status": "success",
@@ -266,8 +324,8 @@ async def list_fields(org_id: str, farmer_id: str = Query(...)):
         List of fields with boundaries
     """
     try:
-        fields = await jdoc_client.get_fields(farmer_id, org_id, include_boundaries=True)
-        return {"fields": fields, "count": len(fields)}
+        fields = await fields_cache.get_fields(farmer_id, org_id, include_boundaries=True)
+        return ORJSONResponse({"fields": fields, "count": len(fields)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -283,8 +341,8 @@ async def sync_fields_to_db(
         fields = await jdoc_client.get_fields(
             farmer_id, org_id, include_boundaries=True
         )
-        for field in fields:
-            db.upsert_field(org_id, field)
+        fields_cache.store(farmer_id, org_id, True, fields)
+        await asyncio.to_thread(get_db().upsert_fields_bulk, org_id, fields)
 
         return {
             "status": "success",
@@ -304,7 +362,8 @@ async def get_field_operations(
     org_id: str = Query(...),
     farmer_id: str = Query(...),
     start_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z"),
-    end_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z")
+    end_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z"),
+    include_payload: bool = Query(False, description="Also return the operations themselves, not just the count")
 ):
     """
     Get operations for a specific field within a date range and
@@ -316,22 +375,24 @@ async def get_field_operations(
             farmer_id, org_id, field_id, start_date, end_date
         )
 
-        # NEW: persist each operation as raw JSON
-        for op in operations:
-            db.upsert_raw_operation(
-                org_id=org_id,
-                field_id=field_id,
-                operation=op,
-            )
+        # NEW: persist the operations as raw JSON, in one transaction
+        await asyncio.to_thread(
+            get_db().upsert_raw_operations_bulk,
+            org_id=org_id,
+            field_id=field_id,
+            operations=operations,
+        )
 
-        return {
+        payload = {
             "status": "success",
             "farmer_id": farmer_id,
             "org_id": org_id,
             "field_id": field_id,
             "count": len(operations),
-            "operations": operations,
         }
+        if include_payload:
+            payload["operations"] = operations
+        return ORJSONResponse(payload)
     except Exception as e:
         logger.error(f"Failed to fetch/store operations: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -344,105 +405,77 @@ async def get_normalized_field_operations(
     org_id: str = Query(...),
     farmer_id: str = Query(...),
     start_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z"),
-    end_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z")
+    end_date: Optional[str] = Query(None, description="ISO format: YYYY-MM-DDTHH:MM:SS.000Z"),
+    include_payload: bool = Query(False, description="Also return the normalized operations, not just the count")
 ):
     """
     Get NORMALIZED field operations for a specific field within a date range.
     Also stores raw and normalized operations in SQLite.
     """
     try:
-        # 1) Get the raw operations from JDOC
-        raw_operations = await jdoc_client.get_field_operations(
-            farmer_id, org_id, field_id, start_date, end_date
-        )
-
-        # 2) Store raw JSON in operations_raw
-        for raw_op in raw_operations:
-            try:
-                db.upsert_raw_operation(
-                    org_id=org_id,
-                    field_id=field_id,
-                    operation=raw_op,
-                )
-            except Exception as e:
-                logger.error(f"Error upserting raw operation {raw_op.get('id')}: {e}", exc_info=True)
-
-        # 3) Get field name (same as before)
-        field_name = field_id  # Fallback
-        try:
-            fields = await jdoc_client.get_fields(farmer_id, org_id, include_boundaries=False)
-            for field in fields:
-                if field.get("id") == field_id:
-                    field_name = field.get("name", field_id)
-                    break
-        except Exception:
-            pass
-
-        org_name = org_id
-
-        # 4) Normalize using your existing normalize_operation
-
-        from app.jdoc_api import normalize_operation
+        # 1) Both names in one SQLite lookup when the field was synced
+        # before. Otherwise look the field name up (falls back to field_id)
+        # while the operations start streaming; it's only needed once the
+        # first arrives
+        stored_org_name, field_name = await asyncio.to_thread(get_db().get_org_and_field_names, org_id, field_id)
+        org_name = stored_org_name or org_id
+        field_name_task = None
+        if field_name is None:
+            field_name_task = asyncio.create_task(
+                fields_cache.get_field_name(farmer_id, org_id, field_id)
+            )
 
+        # 2) Stream raw operations from JDOC and normalize each one (and
+        # map it to its DB row) as it is parsed, instead of decoding the
+        # whole payload up front
+        raw_operations = []
         normalized_ops = []
-        for raw_op in raw_operations:
-            try:
-                normalized_model = normalize_operation(
-                    raw_op,
-                    field_id=field_id,
-                    field_name=field_name,
-                    org_id=org_id,
-                    org_name=org_name,
-                )
-                # Pydantic v2: model_dump(), v1: dict()
-                if hasattr(normalized_model, "model_dump"):
-                    normalized = normalized_model.model_dump()
-                else:
-                    normalized = normalized_model.dict()
+        db_rows = []
+        try:
+            async for raw_op in jdoc_client.iter_field_operations(
+                farmer_id, org_id, field_id, start_date, end_date
+            ):
+                raw_operations.append(raw_op)
+                if field_name is None:
+                    field_name = await field_name_task
+                try:
+                    normalized = normalize_operation_dict(
+                        raw_op,
+                        field_id=field_id,
+                        field_name=field_name,
+                        org_id=org_id,
+                        org_name=org_name,
+                    )
+                    db_row = normalized_operation_row(normalized)
+                except Exception as e:
+                    logger.error(
+                        f"Error normalizing operation {raw_op.get('id')}: {e}",
+                        exc_info=True,
+                    )
+                    continue
                 normalized_ops.append(normalized)
-            except Exception as e:
-                logger.error(
-                    f"Error normalizing operation {getattr(raw_op, 'id', None)}: {e}",
-                    exc_info=True,
-                )
-                continue
+                db_rows.append(db_row)
+        finally:
+            # No-op if it finished; otherwise don't leave it running
+            if field_name_task is not None:
+                field_name_task.cancel()
 
+        # 3) Store raw JSON in operations_raw
+        try:
+            await asyncio.to_thread(
+                get_db().upsert_raw_operations_bulk,
+                org_id=org_id,
+                field_id=field_id,
+                operations=raw_operations,
+            )
+        except Exception as e:
+            logger.error(f"Error upserting raw operations for field {field_id}: {e}", exc_info=True)
 
-        # 5) ADAPT normalized dicts to DB schema before insert
-        db_rows = []
-        for n in normalized_ops:
-            raw = n.get("raw_jdoc_data") or {}
-            op_id = raw.get("id") or f"{field_id}-{n.get('date')}"
-
-            op_date = n.get("date")
-            operation_date = op_date
-            start_time = op_date
-            end_time = op_date
-
-            db_rows.append({
-                "operation_id": op_id,
-                "field_id": n.get("field_id"),
-                "org_id": n.get("org_id"),
-                "operation_type": n.get("operation_type"),
-                "operation_date": operation_date,
-                "start_time": start_time,
-                "end_time": end_time,
-                "crop_name": n.get("crop_name"),
-                "product_name": n.get("product_name"),
-                "product_category": None,
-                "rate_value": n.get("rate"),
-                "rate_unit": n.get("rate_unit"),
-                "total_amount": n.get("amount"),
-                "total_amount_unit": None,
-                "area_ha": n.get("area"),
-                "equipment_name": None,
-                "notes": None,
-            })
-
-        # 6) Insert into operations_normalized
+        # 4) Insert into operations_normalized
         if db_rows:
             try:
-                db.insert_normalized_operations(
+                await asyncio.to_thread(
+                    get_db().insert_normalized_operations,
                     org_id=org_id,
                     field_id=field_id,
                     normalized_ops=db_rows,
@@ -450,11 +483,13 @@ async def get_normalized_field_operations(
             except Exception as e:
                 logger.error(f"Error inserting normalized operations: {e}", exc_info=True)
 
-        return {
-            "operations": normalized_ops,
+        payload = {
             "count": len(normalized_ops),
             "note": "Normalized format - easier to use for analytics",
         }
+        if include_payload:
+            payload["operations"] = normalized_ops
+        return ORJSONResponse(payload)
 
     except Exception as e:
         logger.error(f"Failed to fetch/normalize/store operations: {e}", exc_info=True)
@@ -503,54 +538,54 @@ async def get_field_operations_with_sync(
             &farmer_id=farmer1
             &mode=incremental
     """
-    from datetime import datetime, timedelta
+    from datetime import datetime, timedelta, timezone
     from app.jdoc_api import normalize_operation
     
     try:
+        # One clock read per request; JDOC dates are millisecond UTC with "Z"
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        
         # Determine date range based on mode
         if mode == "incremental":
-            # Get the last sync state for this field
-            sync_state = db.get_sync_state(farmer_id, org_id, field_id)
+            # Get the last sync state for this field. It is this endpoint's
+            # (and the snapshot's) own cursor: the org watermarks track what
+            # /admin/sync/farmer stored, which this caller never saw
+            sync_state = await asyncio.to_thread(get_db().get_sync_state, farmer_id, org_id, field_id)
+            start_date = None
+            if sync_state and sync_state.get('last_synced_at'):
+                # Restart a little before the last window's end (see INCREMENTAL_SYNC_OVERLAP)
+                start_date = sync_state.get('last_sync_overlap_from') or sync_state.get('last_sync_end_date')
             
-            if not sync_state or not sync_state.get('last_synced_at'):
+            if not start_date:
                 # No previous sync, fall back to full_history with 5 years
-                return JSONResponse({
+                return ORJSONResponse({
                     "warning": "No previous sync found for this field, falling back to full_history (5 years)",
                     "mode_used": "full_history",
                     "note": "Run this again with mode=incremental next time after this completes"
                 }, status_code=202)  # 202 Accepted - operation started
             
-            # Use last sync end date as new start date
-            start_date = sync_state.get('last_sync_end_date')
             if end_date is None:
-                end_date = datetime.now().isoformat() + "Z"
+                end_date = now_iso
             
             sync_mode = "incremental"
         
         else:  # full_history mode
             # Calculate start date as N years ago
-            start_date = (datetime.now() - timedelta(days=365*lookback_years)).isoformat() + "Z"
+            start_date = (now - timedelta(days=365*lookback_years)).isoformat(timespec="milliseconds").replace("+00:00", "Z")
             if end_date is None:
-                end_date = datetime.now().isoformat() + "Z"
+                end_date = now_iso
             
             sync_mode = "full_history"
         
-        # Fetch raw operations from JDOC
-        raw_operations = await jdoc_client.get_field_operations(
-            farmer_id, org_id, field_id, start_date, end_date
+        # Fetch raw operations from JDOC and the field name side by side
+        raw_operations, field_name = await asyncio.gather(
+            jdoc_client.get_field_operations(
+                farmer_id, org_id, field_id, start_date, end_date
+            ),
+            fields_cache.get_field_name(farmer_id, org_id, field_id)
         )
         
-        # Get field name
-        field_name = field_id
-        try:
-            fields = await jdoc_client.get_fields(farmer_id, org_id, include_boundaries=False)
-            for field in fields:
-                if field.get("id") == field_id:
-                    field_name = field.get("name", field_id)
-                    break
-        except:
-            pass
-        
         # Transform to normalized format
         normalized_ops = []
         for raw_op in raw_operations:
@@ -564,12 +599,13 @@ async def get_field_operations_with_sync(
                 )
                 normalized_ops.append(normalized)
             except Exception as e:
-                print(f"Error normalizing operation: {e}")
+                logger.warning("Error normalizing operation %s: %s", raw_op.get("id"), e)
                 continue
         
         # Save sync state for future incremental pulls
         try:
-            db.save_sync_state(
+            await asyncio.to_thread(
+                get_db().save_sync_state,
                 farmer_id=farmer_id,
                 org_id=org_id,
                 field_id=field_id,
@@ -579,9 +615,11 @@ async def get_field_operations_with_sync(
                 end_date=end_date
             )
         except Exception as e:
-            print(f"Warning: Could not save sync state: {e}")
+            logger.warning("Could not save sync state for field %s: %s", field_id, e)
         
-        return {
+        # normalized_ops are models: let pydantic's serializer emit the
+        # bytes directly instead of dumping to dicts first
+        return Response(content=to_json({
             "operations": normalized_ops,
             "count": len(normalized_ops),
             "sync_info": {
@@ -591,37 +629,58 @@ async def get_field_operations_with_sync(
                 "field_id": field_id,
                 "start_date": start_date,
                 "end_date": end_date,
-                "synced_at": datetime.now().isoformat()
+                "synced_at": now.isoformat()
             },
             "note": "Operations are normalized and sync state has been saved for next incremental pull"
-        }
+        }), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-VALID_TABLES = {
-    "organizations",
-    "fields",
-    "operations_raw",
-    "operations_normalized",
-    "field_sync_state",
-    "connected_organizations",
-    "user_tokens",
-}
+VALID_TABLES = ADMIN_TABLES
 
 
 @app.get("/admin/tables/{table_name}")
-async def view_table(table_name: str):
+async def view_table(
+    table_name: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+):
+    """One page of a table's rows; count is the table's total row count."""
     if table_name not in VALID_TABLES:
         raise HTTPException(status_code=400, detail="Invalid table name")
 
-    rows = db.fetch_all_rows(table_name)
-    return {
+    # Reads run in a worker thread so they don't stall the loop
+    total, rows = await asyncio.to_thread(get_db().fetch_rows_page, table_name, limit, offset)
+    # Returning the response directly skips FastAPI's jsonable_encoder walk
+    # over every cell; orjson serializes the rows in one pass
+    return ORJSONResponse({
         "table": table_name,
-        "count": len(rows),
+        "count": total,
+        "limit": limit,
+        "offset": offset,
         "rows": rows,
-    }
+    })
+
+
+def _csv_stream(batches):
+    """
+    CSV text for a header row followed by row batches, one chunk per batch.
+    A plain generator, so StreamingResponse iterates it (and the SQLite
+    fetches behind it) in the threadpool rather than on the event loop.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(next(batches))
+    for batch in batches:
+        writer.writerows(batch)
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+    # Header only, when there were no rows
+    if output.tell():
+        yield output.getvalue()
 
 
 @app.get("/admin/tables/{table_name}/download")
@@ -629,16 +688,8 @@ async def download_table_csv(table_name: str):
     if table_name not in VALID_TABLES:
         raise HTTPException(status_code=400, detail="Invalid table name")
 
-    cols, rows = db.fetch_all_rows_raw(table_name)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(cols)
-    writer.writerows(rows)
-    output.seek(0)
-
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _csv_stream(get_db().iter_all_rows_raw(table_name)),
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{table_name}.csv"',
@@ -648,20 +699,42 @@ async def download_table_csv(table_name: str):
 
 
 
+@app.get("/admin/organizations/{org_id}/fields/boundaries")
+async def list_field_boundaries(org_id: str):
+    """
+    Boundary overview for the fields stored for an organization
+    (count and active boundary per field, geometry omitted).
+    """
+    rows = await asyncio.to_thread(get_db().get_field_boundary_summaries, org_id)
+    return ORJSONResponse({
+        "org_id": org_id,
+        "count": len(rows),
+        "fields": rows,
+    })
+
+
 @app.get("/admin/operations/normalized")
 async def list_normalized_operations(
     org_id: Optional[str] = Query(None),
     field_id: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
 ):
     """
-    Flat view of normalized operations, joined with org & field names.
+    Flat view of normalized operations, joined with org & field names, one
+    page at a time (count is the total matching the filters).
     Optional filters: org_id, field_id.
     """
-    rows = db.fetch_all_normalized_operations(org_id=org_id, field_id=field_id)
-    return {
-        "count": len(rows),
+    total, rows = await asyncio.to_thread(
+        get_db().fetch_normalized_operations_page,
+        org_id=org_id, field_id=field_id, limit=limit, offset=offset,
+    )
+    return ORJSONResponse({
+        "count": total,
+        "limit": limit,
+        "offset": offset,
         "operations": rows,
-    }
+    })
 
 
 @app.get("/admin/operations/normalized/download")
@@ -672,73 +745,113 @@ async def download_normalized_operations_csv(
     """
     Download all normalized operations (optionally filtered) as CSV.
     """
-    # Reuse the DB helper but we need columns + rows
-    conn = sqlite3.connect(db.db_path)
-    cursor = conn.cursor()
-
-    base_sql = """
-        SELECT
-          o.operation_id,
-          o.org_id,
-          org.name AS org_name,
-          o.field_id,
-          f.name AS field_name,
-          o.operation_type,
-          o.operation_date,
-          o.start_time,
-          o.end_time,
-          o.crop_name,
-          o.product_name,
-          o.product_category,
-          o.rate_value,
-          o.rate_unit,
-          o.total_amount,
-          o.total_amount_unit,
-          o.area_ha,
-          o.equipment_name,
-          o.notes
-        FROM operations_normalized o
-        LEFT JOIN fields f
-          ON o.field_id = f.field_id
-        LEFT JOIN organizations org
-          ON o.org_id = org.org_id
+    return StreamingResponse(
+        _csv_stream(get_db().iter_normalized_operations_raw(org_id=org_id, field_id=field_id)),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": 'attachment; filename="operations_normalized.csv"',
+        },
+    )
+
+
+
+def _store_org_sync(
+    farmer_id: str,
+    org: Dict,
+    field_ops: List[Tuple[Dict, Optional[List[Dict]]]],
+    fields_fetched: bool,
+    watermark_end: Optional[str]
+) -> Tuple[int, int]:
+    """
+    Store one org of a farmer sync in a single transaction: the org, its
+    fields, every fetched field's raw and normalized operations (marking
+    those fields as synced) and, when watermark_end is given and everything
+    was stored, the org's watermark.
+    field_ops pairs each field with its raw operations (None if the fetch
+    failed). Blocking: run it through asyncio.to_thread.
+
+    Returns:
+        (fields stored, normalized operations stored)
     """
+    oid = org["id"]
+    synced_fields = 0
+    synced_ops = 0
+    with get_db().transaction() as conn:
+        # Ensure org is in DB (if get_organizations doesn't already upsert)
+        try:
+            get_db().upsert_organization(farmer_id, org, conn=conn)
+        except Exception as e:
+            logger.error(f"Error upserting organization {oid}: {e}", exc_info=True)
 
-    conditions = []
-    params = []
+        # The watermark only moves once every field of the org is stored
+        org_stored = fields_fetched
+        stored_field_ids = []
 
-    if org_id:
-        conditions.append("o.org_id = ?")
-        params.append(org_id)
-    if field_id:
-        conditions.append("o.field_id = ?")
-        params.append(field_id)
+        # Save the org's fields in DB
+        try:
+            get_db().upsert_fields_bulk(oid, [field for field, _ in field_ops], conn=conn)
+            synced_fields = len(field_ops)
+        except Exception as e:
+            logger.error(f"Error upserting fields for org {oid}: {e}", exc_info=True)
+            org_stored = False
+        for field, raw_ops in field_ops:
+            fid = field.get("id")
 
-    if conditions:
-        base_sql += " WHERE " + " AND ".join(conditions)
+            if raw_ops is None:
+                org_stored = False
+                continue
 
-    cursor.execute(base_sql, params)
-    cols = [d[0] for d in cursor.description]
-    rows = cursor.fetchall()
-    conn.close()
+            stored = True
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(cols)
-    writer.writerows(rows)
-    output.seek(0)
+            # raw → operations_raw
+            try:
+                get_db().upsert_raw_operations_bulk(org_id=oid, field_id=fid, operations=raw_ops, conn=conn)
+            except Exception as e:
+                logger.error(f"Error storing raw operations for field {fid}: {e}", exc_info=True)
+                stored = False
+
+            # Store normalized operations, mapped straight to DB rows
+            db_rows, failures = normalize_operations_bulk(
+                raw_ops,
+                field_id=fid,
+                field_name=field.get("name", fid),
+                org_id=oid,
+                org_name=org.get("name", oid),
+            )
+            for op_id, error in failures:
+                logger.error(f"Error normalizing operation {op_id}: {error}")
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": 'attachment; filename="operations_normalized.csv"',
-        },
-    )
+            if db_rows:
+                try:
+                    get_db().insert_normalized_operations(
+                        org_id=oid,
+                        field_id=fid,
+                        normalized_ops=db_rows,
+                        conn=conn,
+                    )
+                    synced_ops += len(db_rows)
+                except Exception as e:
+                    logger.error(f"Error inserting normalized operations for field {fid}: {e}", exc_info=True)
+                    stored = False
 
+            if stored:
+                stored_field_ids.append(fid)
+            else:
+                org_stored = False
 
+        try:
+            get_db().mark_fields_ops_synced(stored_field_ids, conn=conn)
+        except Exception as e:
+            logger.error(f"Error marking synced fields for org {oid}: {e}", exc_info=True)
+            org_stored = False
+
+        if watermark_end is not None and org_stored and field_ops:
+            try:
+                get_db().save_sync_watermarks_bulk(farmer_id, {oid: watermark_end}, conn=conn)
+            except Exception as e:
+                logger.error(f"Error saving sync watermark for org {oid}: {e}", exc_info=True)
+    return synced_fields, synced_ops
 
-from typing import Optional
 
 @app.post("/admin/sync/farmer")
 async def sync_farmer_data(
@@ -753,123 +866,89 @@ async def sync_farmer_data(
     - fields (per organization)
     - operations_raw
     - operations_normalized
+    - sync_watermarks
+
+    Without start_date, fields stored by an earlier run only fetch
+    operations since their org's watermark (less INCREMENTAL_SYNC_OVERLAP);
+    fields this sync hasn't stored before (e.g. new to the org) are
+    fetched from the start.
     """
+    # The window end becomes the org watermark, which is compared as a
+    # string, so bring it to JDOC's exact format first
+    if end_date is not None:
+        try:
+            end_date = jdoc_timestamp(end_date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid end_date: {end_date}")
+
     synced_orgs = 0
     synced_fields = 0
     synced_ops = 0
 
     # 1) Get organizations (either all or a specific one)
     orgs = await jdoc_client.get_organizations(farmer_id)
+    organizations_cache.store(farmer_id, orgs)
 
     if org_id:
         orgs = [o for o in orgs if o.get("id") == org_id]
 
-    for org in orgs:
-        oid = org.get("id")
-        if not oid:
-            continue
-        synced_orgs += 1
-
-        # Ensure org is in DB (if get_organizations doesn't already upsert)
-        try:
-            db.upsert_organization(farmer_id, org)
-        except Exception as e:
-            logger.error(f"Error upserting organization {oid}: {e}", exc_info=True)
-
-        # 2) Fetch fields for this org
-        try:
-            fields = await jdoc_client.get_fields(farmer_id, oid, include_boundaries=True)
-        except Exception as e:
-            logger.error(f"Error fetching fields for org {oid}: {e}", exc_info=True)
-            continue
-
-        for field in fields:
-            fid = field.get("id")
-            if not fid:
-                continue
-
-            # Save field in DB
-            try:
-                db.upsert_field(oid, field)
-                synced_fields += 1
-            except Exception as e:
-                logger.error(f"Error upserting field {fid} for org {oid}: {e}", exc_info=True)
-
-            # 3) Fetch raw operations for this field
-            try:
-                raw_ops = await jdoc_client.get_field_operations(
-                    farmer_id, oid, fid, start_date, end_date
-                )
-            except Exception as e:
-                logger.error(f"Error fetching operations for field {fid}, org {oid}: {e}", exc_info=True)
-                continue
-
-            from app.jdoc_api import normalize_operation
-
-            # 3a) Store raw & normalized operations
-            normalized_ops = []
-            for raw_op in raw_ops:
-                try:
-                    # raw → operations_raw
-                    db.upsert_raw_operation(org_id=oid, field_id=fid, operation=raw_op)
+    orgs = [o for o in orgs if o.get("id")]
 
-                    # normalize → NormalizedOperation model
-                    norm_model = normalize_operation(
-                        raw_op,
-                        field_id=fid,
-                        field_name=field.get("name", fid),
-                        org_id=oid,
-                        org_name=org.get("name", oid),
-                    )
+    # 2) Fetch fields for every org concurrently
+    fields_by_org = await jdoc_client.get_fields_many(
+        farmer_id, [o["id"] for o in orgs], include_boundaries=True
+    )
+    for oid, fields in fields_by_org.items():
+        fields_cache.store(farmer_id, oid, True, fields)
 
-                    # Pydantic v1/v2
-                    if hasattr(norm_model, "model_dump"):
-                        norm_dict = norm_model.model_dump()
-                    else:
-                        norm_dict = norm_model.dict()
+    # 3) Fetch raw operations for every field of every org concurrently
+    fields_by_org = {
+        oid: [f for f in fields if f.get("id")] for oid, fields in fields_by_org.items()
+    }
+    # Without a start_date, fields already stored resume from their org's
+    # watermark (one row per org); orgs never synced, and fields not stored
+    # before, pull full history
+    watermarks = {}
+    synced_fields_before = set()
+    if start_date is None:
+        watermarks, synced_fields_before = await asyncio.gather(
+            asyncio.to_thread(get_db().get_sync_watermarks, farmer_id),
+            asyncio.to_thread(get_db().get_ops_synced_fields, farmer_id),
+        )
+    # Close open-ended windows at "now" so the watermark records where they stopped
+    window_end = end_date or datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    date_ranges = {
+        (oid, f["id"]): (
+            start_date or (watermarks.get(oid) if (oid, f["id"]) in synced_fields_before else None),
+            window_end,
+        )
+        for oid, fields in fields_by_org.items() for f in fields
+    }
+    ops_by_field = await jdoc_client.get_all_field_operations(
+        farmer_id, list(date_ranges), date_ranges=date_ranges
+    )
 
-                    normalized_ops.append(norm_dict)
-                except Exception as e:
-                    logger.error(f"Error normalizing/storing operation: {e}", exc_info=True)
-                    continue
+    for org in orgs:
+        oid = org["id"]
+        synced_orgs += 1
 
-            if normalized_ops:
-                try:
-                    # adapt to DB schema (same mapping you use in /operations/normalized)
-                    db_rows = []
-                    for n in normalized_ops:
-                        raw = n.get("raw_jdoc_data") or {}
-                        op_id = raw.get("id") or f"{fid}-{n.get('date')}"
-                        op_date = n.get("date")
-
-                        db_rows.append({
-                            "operation_id": op_id,
-                            "field_id": n.get("field_id"),
-                            "org_id": n.get("org_id"),
-                            "operation_type": n.get("operation_type"),
-                            "operation_date": op_date,
-                            "start_time": op_date,
-                            "end_time": op_date,
-                            "crop_name": n.get("crop_name"),
-                            "product_name": n.get("product_name"),
-                            "product_category": None,
-                            "rate_value": n.get("rate"),
-                            "rate_unit": n.get("rate_unit"),
-                            "total_amount": n.get("amount"),
-                            "total_amount_unit": None,
-                            "area_ha": n.get("area"),
-                            "equipment_name": None,
-                            "notes": None,
-                        })
-
-                    db.insert_normalized_operations(
-                        org_id=oid,
-                        field_id=fid,
-                        normalized_ops=db_rows,
-                    )
-                    synced_ops += len(db_rows)
-                except Exception as e:
-                    logger.error(f"Error inserting normalized operations for field {fid}: {e}", exc_info=True)
+        # Failed fetches are missing from ops_by_field -> None (field saved, ops skipped)
+        field_ops = [(f, ops_by_field.get((oid, f["id"]))) for f in fields_by_org.get(oid, [])]
+
+        # 4) Write the whole org in one transaction, in a worker thread so
+        # neither the writes nor the normalization stall the event loop
+        org_fields, org_ops = await asyncio.to_thread(
+            _store_org_sync,
+            farmer_id,
+            org,
+            field_ops,
+            oid in fields_by_org,
+            # An explicit start_date may leave a gap after the old
+            # watermark, so only resumed (incremental) windows advance it
+            window_end if start_date is None else None,
+        )
+        synced_fields += org_fields
+        synced_ops += org_ops
 
     return {
         "status": "success",
@@ -889,38 +968,23 @@ async def get_dashboard_summary():
     """
     Summary stats for admin overview page.
     """
-    summary = db.get_dashboard_summary()
-
     # For now, farmers_count = distinct farmer_id in organizations
-    conn = sqlite3.connect(db.db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(DISTINCT farmer_id) FROM organizations")
-    farmers_count = cursor.fetchone()[0]
-    conn.close()
+    summary = await asyncio.to_thread(get_db().get_dashboard_summary)
 
     return {
         "organizations_connected": summary["organizations_count"],
         "fields_connected": summary["fields_count"],
         "total_area_ha": summary["total_area_ha"],
         "operations_count": summary["operations_count"],
-        "farmers_connected": farmers_count,
+        "farmers_connected": summary["farmers_count"],
     }
 
 
 
 # ============================================
-# HEALTH & MONITORING ENDPOINTS
+# MONITORING ENDPOINTS
 # ============================================
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for monitoring"""
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT,
-        "api_base": settings.api_base_url
-    }
-
 @app.get("/api/stats")
 async def get_stats():
     """Get basic statistics about connected farmers and organizations"""
@@ -941,24 +1005,198 @@ async def view_sync_states(farmer_id: str = Query(...)):
         farmer_id: Farmer identifier
         
     Returns:
-        All fields and their last sync history
+        All fields and their last sync history, plus each org's next
+        incremental start from its watermark
     """
     try:
-        sync_states = db.get_all_sync_states(farmer_id)
-        return {
+        sync_states, watermarks = await asyncio.gather(
+            asyncio.to_thread(get_db().get_all_sync_states, farmer_id),
+            asyncio.to_thread(get_db().get_sync_watermarks, farmer_id),
+        )
+        return ORJSONResponse({
             "farmer_id": farmer_id,
             "sync_states": sync_states,
-            "count": len(sync_states)
-        }
+            "count": len(sync_states),
+            "watermarks": watermarks
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
 
+async def _snapshot_operations(
+    farmer_id: str,
+    mode: str,
+    orgs_by_id: Dict[str, Dict],
+    fields_with_boundaries: Dict[str, Dict[str, Dict]],
+    date_ranges: Dict[Tuple[str, str], Tuple[str, str]],
+    failed_fields: Dict[str, Dict]
+) -> Dict[str, list]:
+    """
+    Fetch and normalize the operations of every field in date_ranges and
+    record their sync state. Returns {field_id: [normalized_ops]}; fields
+    whose fetch failed map to [], get no sync state and are added to
+    failed_fields as {"status": "timeout" | "error"}.
+
+    The snapshot only exports, so it keeps its own per-field cursor in
+    field_sync_state and never touches the org watermarks that
+    /admin/sync/farmer resumes from.
+    """
+    operations_normalized = {}
+    
+    failures = {}
+    ops_by_field = await jdoc_client.get_all_field_operations(
+        farmer_id, list(date_ranges), date_ranges=date_ranges, failures=failures
+    )
+    
+    fetched = []  # (org_id, field_id, field_name, start_date, end_date)
+    for (org_id, field_id), (start_date, end_date) in date_ranges.items():
+        if (org_id, field_id) not in ops_by_field:
+            # Fetch failed (already logged): empty field, no sync state
+            operations_normalized[field_id] = []
+            error = failures.get((org_id, field_id))
+            failed_fields[field_id] = {
+                "status": "timeout" if isinstance(error, TimeoutError) else "error"
+            }
+            continue
+        field_name = fields_with_boundaries[org_id][field_id].get("name", field_id)
+        fetched.append((org_id, field_id, field_name, start_date, end_date))
+    
+    # Normalize every field's operations; large fields go to worker
+    # processes and run alongside each other
+    normalized_per_field = await asyncio.gather(*[
+        normalize_operations(
+            ops_by_field[(org_id, field_id)],
+            field_id=field_id,
+            field_name=field_name,
+            org_id=org_id,
+            org_name=orgs_by_id[org_id].get("name", org_id)
+        )
+        for org_id, field_id, field_name, _, _ in fetched
+    ])
+    
+    sync_states = []
+    for (org_id, field_id, field_name, start_date, end_date), normalized_ops in zip(fetched, normalized_per_field):
+        operations_normalized[field_id] = normalized_ops
+        sync_states.append({
+            "farmer_id": farmer_id,
+            "org_id": org_id,
+            "field_id": field_id,
+            "field_name": field_name,
+            "sync_mode": mode,
+            "start_date": start_date,
+            "end_date": end_date,
+        })
+    
+    # Save sync state for every fetched field in one transaction
+    try:
+        await asyncio.to_thread(get_db().save_sync_states_bulk, sync_states)
+    except Exception as e:
+        # Continue even if sync state save fails
+        logger.warning("Could not save sync states for farmer %s: %s", farmer_id, e)
+    
+    return operations_normalized
+
+
+async def _stream_snapshot(
+    farmer_id: str,
+    mode: str,
+    orgs_raw: List[Dict],
+    fields_with_boundaries: Dict[str, Dict[str, Dict]],
+    date_ranges: Dict[Tuple[str, str], Tuple[str, str]],
+    sync_info: dict,
+    include: Optional[dict]
+):
+    """
+    NDJSON body for the snapshot: one {"type": "organization"} line per org
+    as soon as its operations are in, then a {"type": "summary"} line. Orgs
+    are processed one at a time (each org's fields still concurrently), so
+    only one org's data is held in memory.
+    """
+    org_include = None
+    if include is not None:
+        org_include = include.get("organizations")
+        if isinstance(org_include, dict):
+            org_include = org_include.get("__all__")
+    
+    total_fields = 0
+    total_operations = 0
+    try:
+        for org_raw in orgs_raw:
+            org_id = org_raw.get("id")
+            org_ranges = {key: window for key, window in date_ranges.items() if key[0] == org_id}
+            operations_normalized = await _snapshot_operations(
+                farmer_id, mode, {org_id: org_raw}, fields_with_boundaries, org_ranges,
+                sync_info["failed_fields"]
+            )
+            
+            for org in build_leaf_like_hierarchy(
+                farmer_id=farmer_id,
+                organizations_raw=[org_raw],
+                fields_with_boundaries=fields_with_boundaries,
+                operations_normalized=operations_normalized
+            ):
+                org_fields = org.get_all_fields()
+                total_fields += len(org_fields)
+                total_operations += sum(len(field.operations) for field in org_fields)
+                if include is None or org_include is not None:
+                    data = org.model_dump_json(include=None if org_include is True else org_include)
+                    yield b'{"type":"organization","data":' + data.encode() + b'}\n'
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        logger.exception("Snapshot stream failed for farmer %s", farmer_id)
+        yield orjson.dumps({"type": "error", "detail": str(e)}) + b"\n"
+        return
+    
+    yield orjson.dumps({
+        "type": "summary",
+        "farmer_id": farmer_id,
+        "sync_info": sync_info,
+        "total_fields": total_fields,
+        "total_operations": total_operations,
+    }) + b"\n"
+
+
+def _projection_include(model, paths: List[str]) -> dict:
+    """
+    Pydantic include= spec for dotted attribute paths, e.g.
+    "organizations.farms.fields.id". List attributes are projected
+    element-wise. Raises ValueError for unknown attributes.
+    """
+    include = {}
+    for path in paths:
+        node, cls = include, model
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            field_info = cls.model_fields.get(part) if cls else None
+            if field_info is None:
+                raise ValueError(f"Unknown field in projection: {path}")
+            if i == len(parts) - 1:
+                node[part] = True
+                break
+            annotation = field_info.annotation
+            inner = getattr(annotation, "__args__", (annotation,))[0]
+            cls = inner if hasattr(inner, "model_fields") else None
+            child = node.get(part)
+            if child is True:
+                break  # already included whole
+            if child is None:
+                child = node[part] = {}
+            if getattr(annotation, "__origin__", None) is list:
+                child = child.setdefault("__all__", {})
+            node = child
+    return include
+
+
 @app.get("/api/farmers/{farmer_id}/snapshot")
 async def get_farmer_snapshot(
     farmer_id: str,
     mode: str = Query("full_history", description="'full_history' or 'incremental'"),
-    lookback_years: int = Query(5, description="Years of history for full_history mode")
+    lookback_years: int = Query(5, description="Years of history for full_history mode"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated projection, e.g. 'total_fields,organizations.farms.fields.id'"
+    ),
+    format: str = Query("json", description="'json' or 'ndjson' (one line per organization, streamed)")
 ):
     """
     Get complete Leaf-like snapshot of farmer's data across all organizations and fields
@@ -979,6 +1217,8 @@ async def get_farmer_snapshot(
     Query params:
         mode: "full_history" or "incremental" (default: full_history)
         lookback_years: Years of history (default: 5)
+        fields: Only return these dotted attribute paths (default: everything)
+        format: "json" (default) or "ndjson" to stream one organization per line
         
     Returns:
         FarmerSnapshot with full hierarchy and all data
@@ -989,95 +1229,81 @@ async def get_farmer_snapshot(
     Example (end of season - since last sync):
         GET /api/farmers/farmer1/snapshot?mode=incremental
     """
-    from datetime import datetime, timedelta
-    from app.jdoc_api import normalize_operation, build_leaf_like_hierarchy
+    from datetime import datetime, timedelta, timezone
     from app.models import FarmerSnapshot
     
+    include = None
+    if fields:
+        try:
+            include = _projection_include(
+                FarmerSnapshot, [p.strip() for p in fields.split(",") if p.strip()]
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # Step 1: Get all organizations
-        orgs_raw = await jdoc_client.get_organizations(farmer_id)
+        orgs_raw = await organizations_cache.get_organizations(farmer_id)
         
         if not orgs_raw:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "No organizations found for this farmer"},
                 status_code=404
             )
         
-        # Step 2: For each org, fetch all fields and operations
+        # Step 2: Fetch every org's fields, then every field's operations,
+        # concurrently (bounded) rather than one round trip at a time
         fields_with_boundaries = {}  # {org_id: {field_id: field_data}}
-        operations_normalized = {}   # {field_id: [normalized_ops]}
         
-        for org in orgs_raw:
-            org_id = org.get("id")
+        orgs_by_id = {org.get("id"): org for org in orgs_raw}
+        fields_by_org = await fields_cache.get_fields_many(
+            farmer_id, list(orgs_by_id), include_boundaries=True
+        )
+        
+        # Determine each field's date range based on mode. The clock is read
+        # once so every field shares the same window (JDOC's ms UTC format)
+        now = datetime.now(timezone.utc)
+        full_start = (now - timedelta(days=365*lookback_years)).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        now_iso = now.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        date_ranges = {}  # {(org_id, field_id): (start_date, end_date)}
+        
+        # One query for every field's snapshot cursor instead of one per
+        # field; fields without one (new, or never snapshotted) get full history
+        last_starts = {}
+        if mode == "incremental":
+            last_starts = {
+                (state["org_id"], state["field_id"]): state.get("last_sync_overlap_from") or state.get("last_sync_end_date")
+                for state in await asyncio.to_thread(get_db().get_all_sync_states, farmer_id)
+                if state.get("last_synced_at")
+            }
+        
+        for org_id in orgs_by_id:
             fields_with_boundaries[org_id] = {}
-            
-            try:
-                # Fetch all fields for this org
-                fields_raw = await jdoc_client.get_fields(farmer_id, org_id, include_boundaries=True)
-                
-                for field in fields_raw:
-                    field_id = field.get("id")
-                    fields_with_boundaries[org_id][field_id] = field
-                    
-                    # Determine date range based on mode
-                    if mode == "incremental":
-                        sync_state = db.get_sync_state(farmer_id, org_id, field_id)
-                        if sync_state and sync_state.get('last_synced_at'):
-                            start_date = sync_state.get('last_sync_end_date')
-                            end_date = datetime.now().isoformat() + "Z"
-                        else:
-                            # Fall back to full history if no previous sync
-                            start_date = (datetime.now() - timedelta(days=365*lookback_years)).isoformat() + "Z"
-                            end_date = datetime.now().isoformat() + "Z"
-                    else:  # full_history
-                        start_date = (datetime.now() - timedelta(days=365*lookback_years)).isoformat() + "Z"
-                        end_date = datetime.now().isoformat() + "Z"
-                    
-                    # Fetch operations for this field
-                    try:
-                        raw_ops = await jdoc_client.get_field_operations(
-                            farmer_id, org_id, field_id, start_date, end_date
-                        )
-                        
-                        # Normalize each operation
-                        normalized_ops = []
-                        for raw_op in raw_ops:
-                            try:
-                                norm_op = normalize_operation(
-                                    raw_op,
-                                    field_id=field_id,
-                                    field_name=field.get("name", field_id),
-                                    org_id=org_id,
-                                    org_name=org.get("name", org_id)
-                                )
-                                normalized_ops.append(norm_op)
-                            except Exception as e:
-                                print(f"Error normalizing operation: {e}")
-                                continue
-                        
-                        operations_normalized[field_id] = normalized_ops
-                        
-                        # Save sync state
-                        try:
-                            db.save_sync_state(
-                                farmer_id=farmer_id,
-                                org_id=org_id,
-                                field_id=field_id,
-                                field_name=field.get("name", field_id),
-                                sync_mode=mode,
-                                start_date=start_date,
-                                end_date=end_date
-                            )
-                        except:
-                            pass  # Continue even if sync state save fails
-                        
-                    except Exception as e:
-                        print(f"Error fetching operations for field {field_id}: {e}")
-                        operations_normalized[field_id] = []
-                
-            except Exception as e:
-                print(f"Error fetching fields for org {org_id}: {e}")
-                continue
+            for field in fields_by_org.get(org_id, []):
+                field_id = field.get("id")
+                fields_with_boundaries[org_id][field_id] = field
+                start_date = last_starts.get((org_id, field_id)) or full_start
+                date_ranges[(org_id, field_id)] = (start_date, now_iso)
+        
+        sync_info = {
+            "mode": mode,
+            "lookback_years": lookback_years,
+            "snapshot_generated_at": now,
+            "failed_fields": {},  # {field_id: {"status": "timeout" | "error"}}
+        }
+        
+        if format == "ndjson":
+            return StreamingResponse(
+                _stream_snapshot(
+                    farmer_id, mode, orgs_raw, fields_with_boundaries, date_ranges, sync_info, include
+                ),
+                media_type="application/x-ndjson"
+            )
+        
+        operations_normalized = await _snapshot_operations(
+            farmer_id, mode, orgs_by_id, fields_with_boundaries, date_ranges,
+            sync_info["failed_fields"]
+        )
         
         # Step 3: Build Leaf-like hierarchy
         organizations = build_leaf_like_hierarchy(
@@ -1087,35 +1313,81 @@ async def get_farmer_snapshot(
             operations_normalized=operations_normalized
         )
         
-        # Step 4: Calculate totals
-        total_fields = sum(len(org.get_all_fields()) for org in organizations)
-        total_operations = sum(
-            sum(len(field.operations) for field in org.get_all_fields())
-            for org in organizations
-        )
+        # Step 4: Calculate totals in one walk over the fields
+        total_fields = 0
+        total_operations = 0
+        for org in organizations:
+            for farm in org.farms:
+                total_fields += len(farm.fields)
+                total_operations += sum(len(field.operations) for field in farm.fields)
         
         # Step 5: Return snapshot
         snapshot = FarmerSnapshot(
             farmer_id=farmer_id,
             organizations=organizations,
-            sync_info={
-                "mode": mode,
-                "lookback_years": lookback_years,
-                "snapshot_generated_at": datetime.now().isoformat()
-            },
+            sync_info=sync_info,
             total_fields=total_fields,
             total_operations=total_operations
         )
         
-        return snapshot.model_dump()
+        # Serialize straight from the model to JSON bytes: no intermediate
+        # dict and no jsonable_encoder pass over the whole hierarchy
+        # include= is applied inside the serializer, so excluded parts
+        # (e.g. boundary polygons) are never encoded at all
+        return Response(content=snapshot.model_dump_json(include=include), media_type="application/json")
         
     except Exception as e:
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Snapshot failed for farmer %s", farmer_id)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/farmers/{farmer_id}/snapshot/jobs", status_code=202)
+async def start_farmer_snapshot_job(
+    farmer_id: str,
+    mode: str = Query("full_history", description="'full_history' or 'incremental'"),
+    lookback_years: int = Query(5, description="Years of history for full_history mode"),
+    fields: Optional[str] = Query(None, description="Comma-separated projection, as for the snapshot")
+):
+    """
+    Build a farmer snapshot in the background instead of holding the
+    request open. Poll status_url; once the job is done it returns the same
+    JSON as GET /api/farmers/{farmer_id}/snapshot. Answers 429 while the
+    maximum number of jobs is already running.
+    """
+    if jobs.full:
+        raise HTTPException(status_code=429, detail="Too many snapshot jobs running, retry later")
+    job_id = jobs.submit(
+        get_farmer_snapshot(farmer_id, mode=mode, lookback_years=lookback_years, fields=fields, format="json")
+    )
+    return {"job_id": job_id, "status": "running", "status_url": f"/api/jobs/{job_id}"}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Status of a background job, or its result once it is done. Jobs are
+    kept in memory by the worker that started them, for up to an hour
+    after they finish.
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    if job["status"] == "done":
+        return job["result"]
+    return {"job_id": job_id, **job}
     
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools come with uvicorn[standard]. Extra workers need
+    # REDIS_URL so OAuth callbacks can land on any of them.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field as PydanticField
 from typing import Optional
 from datetime import datetime
 
@@ -6,6 +6,7 @@ class NormalizedOperation(BaseModel):
     """Normalized operation data that AgriCapture expects"""
     
     # Basic identifiers
+    operation_id: Optional[str] = None  # JDOC field operation id
     field_id: str
     field_name: str
     org_id: str
@@ -31,7 +32,7 @@ class NormalizedOperation(BaseModel):
     area_unit: Optional[str] = None  # "ha" or "acre"
     
     # Raw data for fallback
-    raw_jdoc_data: Optional[dict] = None  # Store original JDOC response for reference
+    raw_jdoc_data: Optional[dict] = None  # Original JDOC response, only kept when DEBUG is on
 
     class Config:
         json_schema_extra = {
@@ -70,21 +71,21 @@ class Field(BaseModel):
     """Field with boundaries and operations"""
     id: str
     name: str
-    boundaries: list[Boundary] = []
-    operations: list[NormalizedOperation] = []
+    boundaries: list[Boundary] = PydanticField(default_factory=list)
+    operations: list[NormalizedOperation] = PydanticField(default_factory=list)
 
 class Farm(BaseModel):
     """Farm containing multiple fields"""
     id: Optional[str] = None
     name: str
-    fields: list[Field] = []
+    fields: list[Field] = PydanticField(default_factory=list)
 
 class Organization(BaseModel):
     """Organization (grower) with farms and fields"""
     id: str
     name: str
     type: str
-    farms: list[Farm] = []
+    farms: list[Farm] = PydanticField(default_factory=list)
     
     def get_all_fields(self) -> list[Field]:
         """Flatten all fields from all farms"""
@@ -96,7 +97,7 @@ class Organization(BaseModel):
 class FarmerSnapshot(BaseModel):
     """Complete snapshot of a farmer's data in Leaf-like hierarchy"""
     farmer_id: str
-    organizations: list[Organization] = []
+    organizations: list[Organization] = PydanticField(default_factory=list)
     sync_info: dict
     total_fields: int = 0
     total_operations: int = 0
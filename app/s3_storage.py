@@ -1,7 +1,13 @@
-import json
+import gzip
+import io
+import orjson
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import List, Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -9,41 +15,79 @@ logger = get_logger(__name__)
 s3_client = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
 BUCKET_NAME = os.getenv("AWS_BUCKET_NAME", "deere-connector-data-demo")
 
+# gzip's default of 9 is several times slower for a few percent less size
+GZIP_LEVEL = 6
 
-def save_deere_data_to_s3(data: dict, data_type: str = "raw") -> dict:
+# Large bodies go up as parallel multipart parts; small ones in one PUT
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Uploads in flight at once for save_many_to_s3
+UPLOAD_WORKERS = 16
+
+
+def _dumps_with_metadata(data: dict, metadata: dict) -> bytes:
+    """
+    JSON for {**data, **metadata} with a trailing newline (one NDJSON
+    record), spliced from the two serialized objects rather than copying
+    every top-level key of `data` into a new dict.
     """
-    Save Deere API response to S3 as JSON
+    if not data.keys().isdisjoint(metadata):
+        # Rare: merge so the output has no duplicate keys
+        return orjson.dumps({**data, **metadata}, option=orjson.OPT_APPEND_NEWLINE)
+    body = orjson.dumps(data)
+    meta = orjson.dumps(metadata, option=orjson.OPT_APPEND_NEWLINE)
+    if body == b"{}":
+        return meta
+    return body[:-1] + b"," + meta[1:]
+
+
+def save_deere_data_to_s3(
+    data: dict,
+    data_type: str = "raw",
+    farmer_id: Optional[str] = None,
+    org_id: Optional[str] = None
+) -> dict:
+    """
+    Save Deere API response to S3 as compact, gzipped JSON on a single
+    line, so objects can be read as NDJSON by Athena / S3 Select
     
     Args:
         data: JSON response from Deere API
         data_type: "raw" or other classification
+        farmer_id: Farmer the data belongs to (key partition)
+        org_id: Organization the data belongs to, if any (key partition)
     
     Returns:
         {"status": "success", "s3_key": "...", "bucket": "..."}
     
-    Example S3 key: raw/year=2025/month=01/day=02/event_2025-01-02T04-30-15.json
+    Example S3 key: raw/farmer=farmer1/org=569776/year=2025/month=01/day=02/event_2025-01-02T04-30-15.123456_1a2b3c4d.json.gz
     """
     try:
         now = datetime.utcnow()
         year, month, day = now.year, now.month, now.day
         timestamp = now.isoformat().replace(":", "-")
         
-        # Add metadata
-        data_with_meta = {
-            **data,
-            "_ingestion_timestamp": now.isoformat(),
-            "_data_type": data_type
-        }
+        # S3 key partitioned by farmer and org first, so listings and
+        # lifecycle rules can be scoped per farmer and request load spreads
+        # across prefixes; the suffix keeps keys unique when several events
+        # are saved in the same instant
+        s3_key = f"{data_type}/farmer={farmer_id or 'none'}/org={org_id or 'none'}/year={year}/month={month:02d}/day={day:02d}/event_{timestamp}_{uuid.uuid4().hex[:8]}.json.gz"
         
-        # S3 key with partition structure
-        s3_key = f"{data_type}/year={year}/month={month:02d}/day={day:02d}/event_{timestamp}.json"
-        
-        # Upload to S3
-        s3_client.put_object(
-            Bucket=BUCKET_NAME,
-            Key=s3_key,
-            Body=json.dumps(data_with_meta, indent=2),
-            ContentType="application/json",
+        # Upload to S3, metadata added during serialization
+        body = gzip.compress(
+            _dumps_with_metadata(data, {"_ingestion_timestamp": now.isoformat(), "_data_type": data_type}),
+            compresslevel=GZIP_LEVEL,
+        )
+        s3_client.upload_fileobj(
+            io.BytesIO(body),
+            BUCKET_NAME,
+            s3_key,
+            ExtraArgs={"ContentType": "application/json", "ContentEncoding": "gzip"},
+            Config=TRANSFER_CONFIG,
         )
         
         logger.info(f"✅ Data saved to S3: s3://{BUCKET_NAME}/{s3_key}")
@@ -63,13 +107,27 @@ def save_deere_data_to_s3(data: dict, data_type: str = "raw") -> dict:
         }
 
 
+def save_many_to_s3(items: List[tuple]) -> List[dict]:
+    """
+    save_deere_data_to_s3 for many (data, data_type[, farmer_id[, org_id]])
+    tuples, uploaded in parallel. Returns one result dict per item, in order.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(UPLOAD_WORKERS, len(items))) as executor:
+        return list(executor.map(lambda item: save_deere_data_to_s3(*item), items))
+
+
 def get_s3_file_content(s3_key: str) -> dict:
     """
-    Retrieve a JSON file from S3
+    Retrieve a JSON file from S3 (gzipped or, for older objects, plain)
     """
     try:
         response = s3_client.get_object(Bucket=BUCKET_NAME, Key=s3_key)
-        content = json.loads(response['Body'].read().decode('utf-8'))
+        body = response['Body'].read()
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.decompress(body)
+        content = orjson.loads(body)
         logger.info(f"✅ Retrieved from S3: {s3_key}")
         return {"status": "success", "data": content}
     
@@ -78,18 +136,23 @@ def get_s3_file_content(s3_key: str) -> dict:
         return {"status": "error", "error": str(e)}
 
 
-def list_s3_files(prefix: str = "raw/", limit: int = 20) -> dict:
+def list_s3_files(prefix: str = "raw/", limit: int = 20, farmer_id: Optional[str] = None) -> dict:
     """
-    List recent files in S3
+    List recent files in S3, following pagination past S3's 1000-keys-per-call
+    cap; with farmer_id, only that farmer's partition under prefix.
+    Blocking: call it through asyncio.to_thread from async code.
     """
+    if farmer_id:
+        prefix = f"{prefix}farmer={farmer_id}/"
     try:
-        response = s3_client.list_objects_v2(
+        paginator = s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
             Bucket=BUCKET_NAME,
             Prefix=prefix,
-            MaxKeys=limit
+            PaginationConfig={"MaxItems": limit, "PageSize": min(limit, 1000)}
         )
         
-        files = [obj['Key'] for obj in response.get('Contents', [])]
+        files = [obj['Key'] for page in pages for obj in page.get('Contents', [])]
         logger.info(f"✅ Listed {len(files)} files from S3")
         
         return {
@@ -12,6 +12,9 @@ API_BASE_URL = os.environ.get("DEERE_CONNECTOR_API_URL", "http://34.200.216.123:
 # Farmer id used with JDOC (update if your app uses multiple farmers)
 DEFAULT_FARMER_ID = os.environ.get("DEERE_FARMER_ID", "anonymous")
 
+# How many org syncs may run against the API at once
+SYNC_CONCURRENCY = int(os.environ.get("SYNC_CONCURRENCY", "4"))
+
 
 def get_db_path() -> str:
     """
@@ -27,15 +30,17 @@ def get_all_org_ids() -> list[str]:
     Read all org_ids from the organizations table.
     """
     db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT org_id FROM organizations")
-    rows = cursor.fetchall()
-    conn.close()
+    # Read-only, so the script never competes with the app for the write lock;
+    # org_id is the primary key, so no DISTINCT (and no sort) is needed
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute("SELECT org_id FROM organizations").fetchall()
+    finally:
+        conn.close()
     return [r[0] for r in rows if r[0]]
 
 
-async def sync_org(farmer_id: str, org_id: str) -> None:
+async def sync_org(client: httpx.AsyncClient, farmer_id: str, org_id: str) -> None:
     """
     Call the existing /admin/sync/farmer endpoint for a single org.
     """
@@ -45,11 +50,10 @@ async def sync_org(farmer_id: str, org_id: str) -> None:
         "org_id": org_id,
         # Optionally add start_date/end_date if you want a window
     }
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        print(f"[SYNC] Calling {url} with farmer_id={farmer_id}, org_id={org_id}")
-        resp = await client.post(url, params=params)
-        resp.raise_for_status()
-        print(f"[SYNC] DONE org_id={org_id}: {resp.json()}")
+    print(f"[SYNC] Calling {url} with farmer_id={farmer_id}, org_id={org_id}")
+    resp = await client.post(url, params=params)
+    resp.raise_for_status()
+    print(f"[SYNC] DONE org_id={org_id}: {resp.json()}")
 
 
 async def main():
@@ -62,9 +66,25 @@ async def main():
 
     print(f"[SYNC] Starting auto sync for farmer_id={farmer_id}, org_ids={org_ids}")
 
-    for oid in org_ids:
-        await sync_org(farmer_id, oid)
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+    async def bounded_sync(client: httpx.AsyncClient, oid: str) -> None:
+        async with semaphore:
+            await sync_org(client, farmer_id, oid)
+
+    # One client for every org, so the requests share its connection pool
+    async with httpx.AsyncClient(timeout=600.0) as client:
+        results = await asyncio.gather(
+            *[bounded_sync(client, oid) for oid in org_ids], return_exceptions=True
+        )
+
+    failed = [(oid, result) for oid, result in zip(org_ids, results) if isinstance(result, BaseException)]
+    for oid, error in failed:
+        print(f"[SYNC] FAILED org_id={oid}: {error!r}")
 
+    if failed:
+        print(f"[SYNC] Auto sync finished with {len(failed)} of {len(org_ids)} orgs failed.")
+        sys.exit(1)
     print("[SYNC] Auto sync complete.")
 
 